@@ -26,14 +26,18 @@ v4.0 변경사항:
 
 from __future__ import annotations
 
+import math
 import os
 import re
-from collections import defaultdict
-from copy import deepcopy
-from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import fitz  # PyMuPDF
+import numpy as np
 
 
 # =========================
@@ -53,10 +57,38 @@ RE_EN_ARTICLE_PAREN = re.compile(
     r"^\s*Article\s*\(\s*(\d+)\s*\)", re.IGNORECASE
 )
 
+# ★ 조문 번호 추출용 단일 패턴: 아래 순서(=우선순위)의 분기를 한 번의 match로 판정
+#   ko       : RE_KO_ARTICLE
+#   (본문참조): RE_EN_ARTICLE_BODY_REF → 캡처 없음 = 조문 아님
+#   en       : RE_EN_ARTICLE_HEADER
+#   en_paren : RE_EN_ARTICLE_PAREN
+#   ko_pre   : "12 제3조" 처럼 앞에 번호가 붙은 한국어 조문
+_RE_ARTICLE_NO_ANY = re.compile(
+    r"\s*제\s*(?P<ko>\d+)\s*조(?:\s|①②③④⑤⑥⑦⑧⑨⑩|$|\(|\[|의|【|〔)"
+    r"|(?i:\s*Article\s+\d+\s+(?:of|the|this|that|in|to|a|an|which|shall|provides|is|are|and|or|has|have|was|were)\b)"
+    r"|(?i:\s*Article\s*\(?\s*(?P<en>\d+)\s*\)?\.?\s*$)"
+    r"|(?i:\s*Article\s*\(\s*(?P<en_paren>\d+)\s*\))"
+    r"|\d+\s+제\s*(?P<ko_pre>\d+)\s*조"
+)
+
 RE_PAGE_NUM_ONLY = re.compile(r"^\s*[-–—]?\s*\d+\s*[-–—]?\s*$")
 RE_INDEX_FRAGMENT = re.compile(r"^\s*제\s*\d+\s*조\s*제\s*\d+\s*(항|호)\b.*$")
 
+# ★ 페이지 점수용: RE_KO_ARTICLE / RE_EN_ARTICLE 를 줄 단위로 합친 MULTILINE 버전
+#   (\s 대신 [^\S\n] 을 써서 매치가 다음 줄로 넘어가지 않게 함)
+_RE_PAGE_ARTICLE_HEAD = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<ko>제[^\S\n]*\d+[^\S\n]*조(?:[^\S\n]|①②③④⑤⑥⑦⑧⑨⑩|$|\(|\[|의|【|〔))"
+    r"|(?P<en>Article[^\S\n]*\(?[^\S\n]*\d+[^\S\n]*\)?\b)"
+    r")",
+    re.MULTILINE | re.IGNORECASE,
+)
+
 _RE_CIRCLED = re.compile(r"[①②③④⑤⑥⑦⑧⑨⑩]")
+# 편/부/장/절/관 구조 헤더
+_RE_STRUCT_HEADER = re.compile(r"^제?\s*[\dIVXivx이일이삼사오육칠팔구십]+\s*(편|부|장|절|관)\s*.{0,40}$")
+# 라인 안에 섞인 "법제처 12 국가법령정보센터" 표기
+_RE_LAW_STAMP = re.compile(r"법제처\s*\d*\s*(?:국가법령정보센터)?\s*")
 
 _KO_NOISE_PATTERNS = [
     r"^\s*법제처\s*\d+\s*$",
@@ -70,6 +102,18 @@ _KO_NOISE_PATTERNS = [
 _EN_NOISE_PATTERNS = [
     r"^\s*Page\s+\d+\s*$",
 ]
+# 노이즈 패턴을 하나의 alternation으로 미리 컴파일 (라인당 정규식 1회 매칭)
+_KO_NOISE_RE = re.compile("|".join(f"(?:{p})" for p in _KO_NOISE_PATTERNS))
+_EN_NOISE_RE = re.compile("|".join(f"(?:{p})" for p in _EN_NOISE_PATTERNS))
+# 위 패턴마다 반드시 들어 있는 리터럴 — 하나도 없는 라인은 정규식 없이 노이즈 아님으로 판정
+_KO_NOISE_LITERALS = ("헌법", "법제처")
+_EN_NOISE_LITERALS = ("Page",)
+
+
+def _is_noise_text(t: str, ko: bool) -> bool:
+    if ko:
+        return any(lit in t for lit in _KO_NOISE_LITERALS) and _KO_NOISE_RE.match(t) is not None
+    return any(lit in t for lit in _EN_NOISE_LITERALS) and _EN_NOISE_RE.match(t) is not None
 
 # =========================
 # v4.1: bbox clamp 상수
@@ -78,11 +122,23 @@ _EN_NOISE_PATTERNS = [
 _BBOX_TOP_MARGIN: float = 45.0     # 상단 45pt 이내 → 페이지 번호 등 skip
 _BBOX_BOTTOM_MARGIN: float = 45.0  # 하단 45pt 이내 → 푸터 clamp
 
+# Page.search_for 가 textpage 미지정 시 쓰는 기본 flags (캐시한 TextPage도 같은 flags로 생성)
+_SEARCH_TEXT_FLAGS: int = (
+    fitz.TEXT_DEHYPHENATE
+    | fitz.TEXT_PRESERVE_WHITESPACE
+    | fitz.TEXT_PRESERVE_LIGATURES
+    | fitz.TEXT_MEDIABOX_CLIP
+)
+
+# 라인 추출용 get_text("dict") 플래그: 기본값(TEXTFLAGS_DICT)에서 이미지 블록만 제외
+# (이미지 블록은 어차피 건너뛰므로 텍스트 결과는 동일, 이미지 바이너리 직렬화만 생략)
+_DICT_TEXT_FLAGS: int = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
 
 # =========================
 # Data Models
 # =========================
-@dataclass
+@dataclass(slots=True)
 class ConstitutionChunk:
     doc_id: str
     country: str
@@ -109,45 +165,93 @@ class ConstitutionChunk:
     article_bbox_info: Optional[List[Dict[str, Any]]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        if d["structure"] is None:
-            d["structure"] = {}
-        if d["bbox_info"] is None:
-            d["bbox_info"] = []
-        if d["article_bbox_info"] is None:
-            d["article_bbox_info"] = []
-        return d
+        # asdict()의 재귀 deepcopy 대신 직접 구성. structure / bbox 항목은 스칼라 값만 담으므로
+        # 한 단계 복사만으로 asdict()와 같은 독립 사본이 된다.
+        return {
+            "doc_id": self.doc_id,
+            "country": self.country,
+            "constitution_title": self.constitution_title,
+            "version": self.version,
+            "seq": self.seq,
+            "page": self.page,
+            "page_english": self.page_english,
+            "page_korean": self.page_korean,
+            "display_path": self.display_path,
+            "structure": dict(self.structure) if self.structure is not None else {},
+            "english_text": self.english_text,
+            "korean_text": self.korean_text,
+            "has_english": self.has_english,
+            "has_korean": self.has_korean,
+            "text_type": self.text_type,
+            "search_text": self.search_text,
+            "bbox_info": [dict(b) for b in self.bbox_info] if self.bbox_info is not None else [],
+            "article_bbox_info": (
+                [dict(b) for b in self.article_bbox_info] if self.article_bbox_info is not None else []
+            ),
+        }
 
 
 # =========================
 # BBox helpers
 # =========================
+_RE_HANGUL = re.compile(r"[가-힣]")
+_RE_LATIN = re.compile(r"[A-Za-z]")
+_RE_SCRIPT_CHAR = re.compile(r"[가-힣A-Za-z]")
+_RE_WS_RUN = re.compile(r"[ \t]+")
+_RE_DIGITS = re.compile(r"\d+")
+# 항 번호 "3 ..." 판정용. 호출부는 첫 글자 isdecimal()(= \d)로 먼저 걸러 대부분의 라인에서 정규식 생략
+_RE_LEAD_NUM = re.compile(r"^(\d+)\s+")
+
+
+# 라인 단위 판정은 같은 텍스트로 여러 단계에서 반복 호출되므로 캐시 (라인 텍스트는 intern 되어 해시 재사용)
+@lru_cache(maxsize=8192)
 def _has_hangul(s: str) -> bool:
-    return bool(re.search(r"[가-힣]", s or ""))
+    return bool(s) and _RE_HANGUL.search(s) is not None
 
 
-def _has_latin(s: str) -> bool:
-    return bool(re.search(r"[A-Za-z]", s or ""))
+def _script_flags(s: str) -> Tuple[bool, bool]:
+    """
+    (한글 포함 여부, 라틴 문자 포함 여부)를 한 번의 스캔으로 판정.
+    첫 문자(한글/라틴) 위치 이후만 나머지 문자군을 찾으므로 문자열을 두 번 훑지 않는다.
+    """
+    if not s:
+        return False, False
+    m = _RE_SCRIPT_CHAR.search(s)
+    if m is None:
+        return False, False
+    if m.group() >= "가":
+        return True, _RE_LATIN.search(s, m.end()) is not None
+    return _RE_HANGUL.search(s, m.end()) is not None, True
 
 
+# 라인 텍스트용 캐시 버전 (페이지 전체를 합친 문자열에는 캐시 없는 _script_flags 사용)
+_line_script_flags = lru_cache(maxsize=8192)(_script_flags)
+
+
+# 헤더/푸터/페이지 번호처럼 페이지마다 반복되는 라인은 캐시 hit
+# 결과는 intern — 원문 공백이 달라도 같은 라인 텍스트는 한 객체를 공유 (반복 엣지 집계/조회 시 해시 재사용)
+@lru_cache(maxsize=8192)
 def _normalize_line(s: str) -> str:
-    s = (s or "").replace("\u00a0", " ")
-    s = re.sub(r"[ \t]+", " ", s)
-    return s.strip()
+    if not s:
+        return ""
+    s = s.replace("\u00a0", " ")
+    # 탭이나 연속 공백이 없으면 [ \t]+ → " " 치환 결과가 원문과 같으므로 정규식 생략
+    if "\t" in s or "  " in s:
+        s = _RE_WS_RUN.sub(" ", s)
+    return sys.intern(s.strip())
 
 
 # ★ v4.1: page_height / margin 파라미터 추가
-def _accum_bbox(
-    acc: Dict[int, Dict[str, float]],
+def _clamp_bbox(
+    bbox: fitz.Rect,
     *,
     page_no: int,
-    bbox: fitz.Rect,
     page_height: float = 0.0,
     top_margin: float = _BBOX_TOP_MARGIN,
     bottom_margin: float = _BBOX_BOTTOM_MARGIN,
-) -> None:
+) -> Optional[Tuple[float, float, float, float]]:
     """
-    페이지별 bbox union 누적.
+    bbox를 (x0, y0, x1, y1) 튜플로 변환하면서 여백 처리. 누적 대상이 아니면 None.
 
     v4.1 변경:
     - page_height > 0 이면 상/하단 여백 영역을 처리:
@@ -156,10 +260,10 @@ def _accum_bbox(
         * bbox 하단(y1)이 하단 여백 경계를 넘으면 y1을 clamp
     """
     if not bbox or page_no <= 0:
-        return
+        return None
     x0, y0, x1, y1 = float(bbox.x0), float(bbox.y0), float(bbox.x1), float(bbox.y1)
     if x1 <= x0 or y1 <= y0:
-        return
+        return None
 
     # ★ v4.1: 페이지 높이 기반 clamp
     if page_height > 0:
@@ -168,28 +272,49 @@ def _accum_bbox(
 
         # 상단 여백 전체에 속하는 bbox → skip (페이지 번호, 헤더)
         if y1 <= content_top:
-            return
+            return None
         # 하단 여백 전체에 속하는 bbox → skip (푸터, 법제처 표기 등)
         if y0 >= content_bottom:
-            return
+            return None
         # y1이 하단 여백 경계를 넘으면 clamp
         y1 = min(y1, content_bottom)
         # y0이 상단 여백 경계 미만이면 clamp
         y0 = max(y0, content_top - top_margin)  # 완전 clamp는 하지 않음 (조 헤더 bbox 보존)
 
         if y1 <= y0:
-            return
+            return None
+
+    return x0, y0, x1, y1
 
-    if page_no not in acc:
+
+def _union_box(acc: Dict[int, Dict[str, float]], page_no: int, box: Tuple[float, float, float, float]) -> None:
+    x0, y0, x1, y1 = box
+    u = acc.get(page_no)
+    if u is None:
         acc[page_no] = {"x0": x0, "y0": y0, "x1": x1, "y1": y1}
     else:
-        u = acc[page_no]
         u["x0"] = min(u["x0"], x0)
         u["y0"] = min(u["y0"], y0)
         u["x1"] = max(u["x1"], x1)
         u["y1"] = max(u["y1"], y1)
 
 
+def _accum_bbox(
+    acc: Dict[int, Dict[str, float]],
+    *,
+    page_no: int,
+    bbox: fitz.Rect,
+    page_height: float = 0.0,
+    top_margin: float = _BBOX_TOP_MARGIN,
+    bottom_margin: float = _BBOX_BOTTOM_MARGIN,
+) -> None:
+    """페이지별 bbox union 누적 (여백 처리는 _clamp_bbox)."""
+    box = _clamp_bbox(bbox, page_no=page_no, page_height=page_height,
+                      top_margin=top_margin, bottom_margin=bottom_margin)
+    if box is not None:
+        _union_box(acc, page_no, box)
+
+
 def _acc_to_boxes(acc: Dict[int, Dict[str, float]]) -> List[Dict[str, Any]]:
     return [
         {
@@ -246,9 +371,15 @@ def _union_bbox_info(
 # =========================
 # v3.9: 컬럼 레이아웃 자동 감지
 # =========================
-def _detect_column_layout(doc: fitz.Document, sample_pages: int = 8) -> Dict[str, Any]:
+def _detect_column_layout(
+    doc: fitz.Document,
+    sample_pages: int = 8,
+    words_cache: Optional[Dict[int, List[Tuple]]] = None,
+) -> Dict[str, Any]:
     """
     PDF 컬럼 구조 자동 감지 (v3.11 단어 커버리지 갭 탐지).
+    words_cache가 주어지면 표본 페이지의 get_text("words") 결과를 {page_index: words}로 남겨
+    본문 추출 단계에서 같은 페이지를 다시 파싱하지 않게 한다.
     """
     if len(doc) == 0:
         return {"is_two_column": False, "col_mid": 0.5, "col_gap": 0.0}
@@ -266,7 +397,8 @@ def _detect_column_layout(doc: fitz.Document, sample_pages: int = 8) -> Dict[str
 
     page_widths: List[float] = []
     BINS = 60
-    coverage = [0] * BINS
+    # 단어가 덮는 빈 구간 [b0, b1]을 차분 배열(+1 / -1)로 누적한 뒤 cumsum → 빈별 커버리지
+    cov_diff = np.zeros(BINS + 1, dtype=np.int64)
 
     for pidx in sample_indices:
         page = doc[pidx]
@@ -274,15 +406,20 @@ def _detect_column_layout(doc: fitz.Document, sample_pages: int = 8) -> Dict[str
         if pw <= 0:
             continue
         words = page.get_text("words")
+        if words_cache is not None:
+            words_cache[pidx] = words
         if not words:
             continue
         page_widths.append(pw)
-        for w in words:
-            wx0, wx1 = w[0] / pw, w[2] / pw
-            b0 = max(0, int(wx0 * BINS))
-            b1 = min(BINS - 1, int(wx1 * BINS))
-            for b in range(b0, b1 + 1):
-                coverage[b] += 1
+        wx0 = np.array([w[0] for w in words], dtype=np.float64) / pw
+        wx1 = np.array([w[2] for w in words], dtype=np.float64) / pw
+        b0 = np.maximum(0, np.trunc(wx0 * BINS).astype(np.int64))
+        b1 = np.minimum(BINS - 1, np.trunc(wx1 * BINS).astype(np.int64))
+        valid = b1 >= b0  # 빈 범위(b0 > b1)인 단어는 커버리지에 기여하지 않음
+        cov_diff += np.bincount(b0[valid], minlength=BINS + 1)
+        cov_diff -= np.bincount(b1[valid] + 1, minlength=BINS + 1)
+
+    coverage = np.cumsum(cov_diff[:BINS]).tolist()
 
     if not page_widths:
         return {"is_two_column": False, "col_mid": 0.5, "col_gap": 0.0}
@@ -343,29 +480,83 @@ def _detect_column_layout(doc: fitz.Document, sample_pages: int = 8) -> Dict[str
     }
 
 
-def _words_to_lines(words: List[Tuple], tol: float = 3.0) -> List[Dict[str, Any]]:
+# 이보다 단어가 적은 페이지(컬럼)는 NumPy 변환 비용이 더 커서 순수 파이썬 경로 사용
+_WORDS_NP_MIN = 128
+
+
+def _word_coords(words: List[Tuple]) -> np.ndarray:
+    """단어 좌표 4열을 (4, N) 배열로 (행별 컴프리헨션이 2D 튜플 변환보다 빠름)"""
+    return np.array(
+        [[w[0] for w in words], [w[1] for w in words], [w[2] for w in words], [w[3] for w in words]],
+        dtype=np.float64,
+    )
+
+
+def _group_words_by_row(
+    words: List[Tuple], tol: float, coords: Optional[np.ndarray] = None
+) -> List[Tuple[List[Tuple], Tuple[float, float, float, float]]]:
+    """
+    단어를 y0 // tol 버킷(행)으로 묶고, 행은 위→아래 / 행 내부는 x0 오름차순으로 정렬.
+    x0가 같으면 원래 단어 순서 유지 (stable).
+    coords: words와 같은 순서의 (4, N) 좌표 배열 (컬럼 분리 때 만든 배열 재사용)
+    반환: [(행 단어 목록, 행 bbox (x0, y0, x1, y1)), ...]
+    """
+    if len(words) < _WORDS_NP_MIN:
+        rows: Dict[int, List] = {}
+        for w in words:
+            rows.setdefault(int(w[1] / tol), []).append(w)
+        out = []
+        for k in sorted(rows):
+            row = sorted(rows[k], key=lambda w: w[0])
+            box = (
+                min(w[0] for w in row),
+                min(w[1] for w in row),
+                max(w[2] for w in row),
+                max(w[3] for w in row),
+            )
+            out.append((row, box))
+        return out
+
+    x0s, y0s, x1s, y1s = _word_coords(words) if coords is None else coords
+    keys = np.trunc(y0s / tol).astype(np.int64)  # int(y / tol) 과 동일한 버킷
+    order = np.lexsort((x0s, keys))  # 1차: 버킷, 2차: x0 (stable)
+    sorted_keys = keys[order]
+    starts = np.concatenate(([0], np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1))
+    # 행별 bbox: 정렬된 좌표를 행 시작 오프셋 기준으로 한 번에 min/max 축약
+    boxes = zip(
+        np.minimum.reduceat(x0s[order], starts).tolist(),
+        np.minimum.reduceat(y0s[order], starts).tolist(),
+        np.maximum.reduceat(x1s[order], starts).tolist(),
+        np.maximum.reduceat(y1s[order], starts).tolist(),
+    )
+    ordered = [words[i] for i in order.tolist()]
+    bounds = starts.tolist() + [len(ordered)]
+    return [
+        (ordered[a:b], box)
+        for a, b, box in zip(bounds[:-1], bounds[1:], boxes)
+    ]
+
+
+def _words_to_lines(
+    words: List[Tuple],
+    tol: float = 3.0,
+    page_height: float = 0.0,
+    coords: Optional[np.ndarray] = None,
+) -> List[Dict[str, Any]]:
     if not words:
         return []
-    rows: Dict[int, List] = {}
-    for w in words:
-        rows.setdefault(int(w[1] / tol), []).append(w)
     out = []
-    for y_key in sorted(rows):
-        row = sorted(rows[y_key], key=lambda w: w[0])
+    for row, box in _group_words_by_row(words, tol, coords=coords):
         text = _normalize_line(" ".join(w[4] for w in row))
         if not text:
             continue
-        x0 = min(w[0] for w in row)
-        y0 = min(w[1] for w in row)
-        x1 = max(w[2] for w in row)
-        y1 = max(w[3] for w in row)
-        out.append({"text": text, "bbox": fitz.Rect(x0, y0, x1, y1)})
+        out.append({"text": text, "bbox": fitz.Rect(box), "page_height": page_height})
     return out
 
 
 # ★ v4.1: 라인 dict에 page_height 포함
 def _page_lines_from_dict(page: fitz.Page) -> List[Dict[str, Any]]:
-    d = page.get_text("dict")
+    d = page.get_text("dict", flags=_DICT_TEXT_FLAGS)
     page_height = page.rect.height  # ★ v4.1
     out: List[Dict[str, Any]] = []
     for b in d.get("blocks", []):
@@ -389,33 +580,32 @@ def _page_lines_two_column(
     page: fitz.Page,
     col_mid: float,
     col_gap: float = 10.0,
+    words: Optional[List[Tuple]] = None,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     margin = max(col_gap * 0.3, 5.0)
     page_height = page.rect.height  # ★ v4.1
-    words = page.get_text("words")
-    left_words = []
-    right_words = []
-    center_words = []
-
-    for w in words:
-        wx0, wx1 = w[0], w[2]
-        word_mid = (wx0 + wx1) / 2.0
-        spans_both = wx0 < col_mid - margin and wx1 > col_mid + margin
-
-        if spans_both:
-            center_words.append(w)
-        elif word_mid < col_mid:
-            left_words.append(w)
-        else:
-            right_words.append(w)
-
-    left_lines  = _words_to_lines(left_words)
-    right_lines = _words_to_lines(right_words)
-    center_lines = _words_to_lines(center_words)
-
-    # ★ v4.1: 두 컬럼 라인에도 page_height 추가
-    for ln in left_lines + right_lines + center_lines:
-        ln["page_height"] = page_height
+    if words is None:
+        words = page.get_text("words")
+    if not words:
+        return [], []
+
+    # 페이지 단어 좌표를 (4, N) 배열로 한 번만 올려 컬럼 마스크 계산과
+    # 컬럼별 행 묶기(_group_words_by_row)에서 같이 사용
+    coords = _word_coords(words)
+    wx0, wx1 = coords[0], coords[2]
+    center_mask = (wx0 < col_mid - margin) & (wx1 > col_mid + margin)
+    left_mask = ~center_mask & ((wx0 + wx1) / 2.0 < col_mid)
+    right_mask = ~(center_mask | left_mask)
+
+    def _column_lines(mask: np.ndarray) -> List[Dict[str, Any]]:
+        idx = np.flatnonzero(mask)
+        col_words = [words[i] for i in idx.tolist()]
+        # ★ v4.1: 두 컬럼 라인에도 page_height 추가 (라인 dict 생성 시 함께 채움)
+        return _words_to_lines(col_words, page_height=page_height, coords=coords[:, idx])
+
+    left_lines = _column_lines(left_mask)
+    right_lines = _column_lines(right_mask)
+    center_lines = _column_lines(center_mask)
 
     def _merge_by_y(a, b):
         merged = a + b
@@ -427,49 +617,123 @@ def _page_lines_two_column(
     return combined_left, combined_right
 
 
+# =========================
+# 페이지 단위 추출 (순차 / 멀티프로세스 공용)
+# =========================
+PageExtract = Tuple[List[Dict[str, Any]], Optional[Tuple[List, List]]]
+
+
+def _extract_page(
+    page: fitz.Page,
+    is_two_column: bool,
+    col_mid: float,
+    col_gap: float,
+    words: Optional[List[Tuple]] = None,
+) -> PageExtract:
+    """
+    한 페이지의 라인 추출 + 헤더/푸터·노이즈 정리.
+    반환: (전체 라인, (좌, 우) 컬럼 라인 또는 None)
+    words: 레이아웃 감지 때 이미 뽑은 단어 목록 (2단 경로에서 재사용)
+    본문 점수는 반복 엣지 라인 제거 후에만 의미가 있으므로 여기서 계산하지 않는다.
+    """
+    page_height = page.rect.height
+    if is_two_column:
+        left_lines, right_lines = _page_lines_two_column(
+            page, col_mid=col_mid, col_gap=col_gap, words=words
+        )
+        left_lines = _clean_page_lines(left_lines, page_height=page_height)
+        right_lines = _clean_page_lines(right_lines, page_height=page_height)
+        all_lines = left_lines + right_lines
+        return all_lines, (left_lines, right_lines)
+    lines = _page_lines_single_column(page)
+    lines = _clean_page_lines(lines, page_height=page_height)
+    return lines, None
+
+
+# 워커 프로세스별로 한 번만 여는 문서 (executor initializer에서 설정)
+_WORKER_DOC: Optional[fitz.Document] = None
+
+
+def _init_page_worker(pdf_path: str) -> None:
+    global _WORKER_DOC
+    _WORKER_DOC = fitz.open(pdf_path)
+
+
+def _extract_page_in_worker(args: Tuple[int, bool, float, float]) -> Tuple[int, PageExtract]:
+    pidx, is_two_column, col_mid, col_gap = args
+    return pidx, _extract_page(_WORKER_DOC[pidx], is_two_column, col_mid, col_gap)
+
+
+def _extract_pages_parallel(
+    pdf_path: str,
+    n_pages: int,
+    workers: int,
+    is_two_column: bool,
+    col_mid: float,
+    col_gap: float,
+) -> List[PageExtract]:
+    """
+    페이지 추출을 워커 프로세스로 분산. executor.map은 입력(페이지) 순서대로 결과를 돌려준다.
+    (중앙 라인 dict의 좌/우 공유는 한 결과 단위로 pickle 되므로 그대로 유지됨)
+    """
+    workers = min(workers, n_pages)
+    chunksize = max(1, n_pages // (4 * workers))
+    tasks = [(pidx, is_two_column, col_mid, col_gap) for pidx in range(n_pages)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_page_worker, initargs=(pdf_path,)
+    ) as executor:
+        return [res for _, res in executor.map(_extract_page_in_worker, tasks, chunksize=chunksize)]
+
+
 # =========================
 # Noise / edge filtering
 # =========================
 RE_PURE_NUM_ONLY = re.compile(r"^\s*\d+\s*$")
+_DASH_TAILS = ("-", "–", "—")
 
 
-def _strip_header_footer_lines(lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    if len(lines) <= 4:
-        return lines
-    strip_top = strip_bot = 0
-    for ln in lines[:2]:
-        t = ln["text"]
-        if RE_PAGE_NUM_ONLY.match(t) or (len(t) <= 30 and not _has_hangul(t) and not _has_latin(t)):
-            strip_top += 1
-        else:
-            break
-    for ln in reversed(lines[-2:]):
-        t = ln["text"]
-        if RE_PAGE_NUM_ONLY.match(t) or (len(t) <= 30 and not _has_hangul(t) and not _has_latin(t)):
-            strip_bot += 1
-        else:
-            break
-    end = len(lines) - strip_bot if strip_bot else len(lines)
-    return lines[strip_top:end]
+def _is_page_num_line(t: str) -> bool:
+    # 페이지 번호 라인은 숫자나 대시로 끝나므로, 마지막 글자로 먼저 걸러 정규식 호출을 줄인다
+    tail = t.rstrip()[-1:]
+    return (tail.isdecimal() or tail in _DASH_TAILS) and RE_PAGE_NUM_ONLY.match(t) is not None
+
+
+def _is_edge_noise(t: str) -> bool:
+    return _is_page_num_line(t) or (len(t) <= 30 and not any(_line_script_flags(t)))
+
 
+def _header_footer_bounds(lines: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """페이지 상/하단 2줄 이내의 페이지 번호류 라인을 제외한 [start, end) 구간."""
+    n = len(lines)
+    if n <= 4:
+        return 0, n
+    start = 0
+    while start < 2 and _is_edge_noise(lines[start]["text"]):
+        start += 1
+    end = n
+    while end > n - 2 and _is_edge_noise(lines[end - 1]["text"]):
+        end -= 1
+    return start, end
 
-def _filter_noise_lines(lines: List[Dict[str, Any]], page_height: Optional[float] = None) -> List[Dict[str, Any]]:
-    ko_pats = [re.compile(p) for p in _KO_NOISE_PATTERNS]
-    en_pats = [re.compile(p) for p in _EN_NOISE_PATTERNS]
+
+def _clean_page_lines(lines: List[Dict[str, Any]], page_height: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    헤더/푸터 제거와 노이즈 라인 필터를 한 번의 순회로 수행.
+    상/하단 경계는 앞뒤 2줄만 보고 먼저 정한 뒤, 그 구간만 노이즈 판정한다.
+    """
+    start, end = _header_footer_bounds(lines)
     out = []
-    for ln in lines:
+    for i in range(start, end):
+        ln = lines[i]
         t = ln["text"]
         is_noise = False
-        if RE_PURE_NUM_ONLY.match(t) and page_height and ln.get("bbox") is not None:
+        if t.rstrip()[-1:].isdecimal() and RE_PURE_NUM_ONLY.match(t) and page_height and ln.get("bbox") is not None:
             bb = ln["bbox"]
             is_noise = bb.y0 < 90 or bb.y1 > (page_height - 90)
         if not is_noise:
-            pats = ko_pats if (_has_hangul(t) or not _has_latin(t)) else en_pats
-            if not _extract_article_no_safe(t):
-                for p in pats:
-                    if p.match(t):
-                        is_noise = True
-                        break
+            has_ko, has_en = _line_script_flags(t)
+            if _is_noise_text(t, has_ko or not has_en) and not _extract_article_no_safe(t):
+                is_noise = True
         if not is_noise:
             out.append(ln)
     return out
@@ -481,67 +745,91 @@ def _detect_repeated_edge_lines(
     n = len(pages_lines)
     if n < 3:
         return set(), set()
-    top: Dict[str, int] = {}
-    bot: Dict[str, int] = {}
+    # c / n >= thr 를 만족하는 최소 등장 횟수 (부동소수 비교 결과와 같도록 경계 보정)
+    need = max(1, math.ceil(thr * n))
+    while need > 1 and (need - 1) / n >= thr:
+        need -= 1
+    while need / n < thr:
+        need += 1
+    # 등장 횟수 집계는 Counter.update (계수 루프가 C에서 동작)
+    top: Counter = Counter()
+    bot: Counter = Counter()
     for lines in pages_lines:
-        for ln in lines[:top_k]:
-            t = ln["text"]; top[t] = top.get(t, 0) + 1
-        for ln in lines[-bottom_k:]:
-            t = ln["text"]; bot[t] = bot.get(t, 0) + 1
-    top_rep = {t for t, c in top.items() if c / n >= thr and len(t) >= 4}
-    bot_rep = {t for t, c in bot.items() if c / n >= thr and len(t) >= 4}
+        top.update(ln["text"] for ln in lines[:top_k] if len(ln["text"]) >= 4)
+        bot.update(ln["text"] for ln in lines[-bottom_k:] if len(ln["text"]) >= 4)
+    top_rep = {t for t, c in top.items() if c >= need}
+    bot_rep = {t for t, c in bot.items() if c >= need}
     return top_rep, bot_rep
 
 
-def _remove_repeated_edge_lines(pages_lines, top_rep, bot_rep, top_k=2, bottom_k=2):
-    cleaned = []
-    for lines in pages_lines:
-        new_lines = []
-        for i, ln in enumerate(lines):
-            t = ln["text"]
-            if i < top_k and t in top_rep:
-                continue
-            if i >= len(lines) - bottom_k and t in bot_rep:
-                continue
-            new_lines.append(ln)
-        cleaned.append(new_lines)
-    return cleaned
+def _strip_repeated_edges(lines, top_rep, bot_rep, top_k=2, bottom_k=2):
+    """한 페이지에서 상단 top_k / 하단 bottom_k 위치의 반복 머리말·꼬리말 라인 제거."""
+    n = len(lines)
+    bottom_start = n - bottom_k
+    if bottom_start < top_k:
+        # 상/하단 구간이 겹치는 짧은 페이지: 라인별로 두 조건 모두 확인
+        return [
+            ln for i, ln in enumerate(lines)
+            if not ((i < top_k and ln["text"] in top_rep)
+                    or (i >= bottom_start and ln["text"] in bot_rep))
+        ]
+    # 후보는 앞/뒤 몇 줄뿐이므로 가운데 구간은 조회 없이 그대로 잘라 붙임
+    head = [ln for ln in lines[:top_k] if ln["text"] not in top_rep] if top_rep else lines[:top_k]
+    tail = [ln for ln in lines[bottom_start:] if ln["text"] not in bot_rep] if bot_rep else lines[bottom_start:]
+    return head + lines[top_k:bottom_start] + tail
 
 
 # =========================
 # Article extraction helpers
 # =========================
 def _extract_article_no_safe(line: str) -> Optional[str]:
-    stripped = line.lstrip()
-    m = RE_KO_ARTICLE.match(stripped)
-    if m:
-        return m.group(1)
-    if RE_EN_ARTICLE_BODY_REF.match(stripped):
-        return None
-    m = RE_EN_ARTICLE_HEADER.match(stripped)
-    if m:
-        return m.group(1)
-    m = RE_EN_ARTICLE_PAREN.match(stripped)
-    if m:
-        return m.group(1)
-    m2 = re.match(r"^\d+\s+제\s*(\d+)\s*조", stripped)
-    if m2:
-        return m2.group(1)
-    return None
+    return _extract_article_no_lang(line)[0]
+
+
+# 조문 번호 분기별 언어: "ko"(라인 선두 "제N조")만 KO로 확정, "ko_pre"는 판정 보류(None)
+_ARTICLE_GROUP_LANG = {"ko": "KO", "en": "EN", "en_paren": "EN", "ko_pre": None}
+
+
+# 같은 라인 텍스트가 정리/채점/버킷 분배/청킹 단계마다 반복 판정되므로 텍스트 기준으로 캐시
+# (라인 dict에 결과를 저장하면 "법제처" 치환 등으로 text가 바뀐 사본에 옛 값이 따라감)
+@lru_cache(maxsize=8192)
+def _extract_article_no_lang(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    (조문 번호, 언어) 를 한 번의 match로 반환.
+    언어 "KO"는 RE_KO_ARTICLE.match(line.lstrip()) 성공과 같다 (동일한 첫 분기).
+    """
+    ls = line.lstrip()
+    # 모든 분기는 (선행 공백 뒤) "제" / "Article"(대소문자 무시) / 숫자로 시작 → 그 외 첫 글자는 정규식 생략
+    head = ls[:1]
+    if not (head == "제" or head == "A" or head == "a" or head.isdecimal()):
+        return None, None
+    m = _RE_ARTICLE_NO_ANY.match(ls)
+    if m is None or m.lastgroup is None:
+        return None, None
+    # 조문 번호는 종류가 적고 청크/structure마다 반복되므로 intern 해서 한 객체를 공유
+    return sys.intern(m.group(m.lastgroup)), _ARTICLE_GROUP_LANG[m.lastgroup]
 
 
 def _extract_article_no(line: str) -> Optional[str]:
     return _extract_article_no_safe(line)
 
 
+@lru_cache(maxsize=1024)
+def _article_body_prefix_res(article_no: str) -> Tuple[re.Pattern, re.Pattern]:
+    """조문 번호별 (KO, EN) 머리말 패턴 — 번호마다 한 번만 컴파일."""
+    return (
+        re.compile(rf"제\s*{re.escape(article_no)}\s*조\s*(?:의\s*\d+\s*)?"),
+        re.compile(rf"Article\s*\(?\s*{re.escape(article_no)}\s*\)?\s*", re.IGNORECASE),
+    )
+
+
 def _extract_body_after_article_no(line: str, article_no: str) -> str:
-    ko_pattern = re.compile(rf"제\s*{re.escape(article_no)}\s*조\s*(?:의\s*\d+\s*)?")
+    ko_pattern, en_pattern = _article_body_prefix_res(article_no)
     m = ko_pattern.search(line)
     if m:
         r = line[m.end():].strip()
         if r:
             return r
-    en_pattern = re.compile(rf"Article\s*\(?\s*{re.escape(article_no)}\s*\)?\s*", re.IGNORECASE)
     m = en_pattern.search(line)
     if m:
         r = line[m.end():].strip()
@@ -567,18 +855,38 @@ def _page_quality_score(lines: List[Dict[str, Any]], country: str = "") -> float
     if not texts:
         return 0.0
     joined = "\n".join(texts)
-    ko_hits = sum(1 for t in texts if RE_KO_ARTICLE.match(t.lstrip()))
-    en_hits = sum(1 for t in texts if RE_EN_ARTICLE.match(t.lstrip()))
-    short_ratio = sum(1 for t in texts if len(t) <= 12) / max(1, len(texts))
-    idx_hits = sum(1 for t in texts if RE_INDEX_FRAGMENT.match(t))
-    avg_len = sum(len(t) for t in texts) / max(1, len(texts))
+    # 조문 헤더(한/영)는 페이지 전체를 한 번만 스캔해서 집계
+    # (라인 자체에 개행이 섞인 경우에만 라인 단위 매칭으로 폴백)
+    ko_hits = en_hits = 0
+    if joined.count("\n") == len(texts) - 1:
+        for m in _RE_PAGE_ARTICLE_HEAD.finditer(joined):
+            if m.group("ko") is not None:
+                ko_hits += 1
+            else:
+                en_hits += 1
+    else:
+        ko_hits = sum(1 for t in texts if RE_KO_ARTICLE.match(t))
+        en_hits = sum(1 for t in texts if RE_EN_ARTICLE.match(t))
+    # 길이 합계는 joined 길이에서 구분 개행 수만 빼면 됨 (라인별 누적 불필요)
+    total_len = len(joined) - (len(texts) - 1)
+    # 짧은 라인 수 / 색인 조각 수를 한 번의 순회로 집계
+    short_cnt = idx_hits = 0
+    for t in texts:
+        if len(t) <= 12:
+            short_cnt += 1
+        # 색인 조각은 첫 글자가 "제"인 라인만 정규식 호출
+        if t.lstrip()[:1] == "제" and RE_INDEX_FRAGMENT.match(t):
+            idx_hits += 1
+    short_ratio = short_cnt / len(texts)
+    avg_len = total_len / len(texts)
     score = (ko_hits + en_hits) * 2.0
     score += min(avg_len / 40.0, 2.0)
     score -= short_ratio * 2.0
     score -= idx_hits * 1.5
-    if _has_hangul(joined) and _has_latin(joined):
+    has_ko, has_en = _script_flags(joined)
+    if has_ko and has_en:
         score += 0.5
-    elif _has_hangul(joined):
+    elif has_ko:
         score += 0.3
     return max(score, 0.0)
 
@@ -586,123 +894,150 @@ def _page_quality_score(lines: List[Dict[str, Any]], country: str = "") -> float
 # =========================
 # Text normalization
 # =========================
-def _remove_noise_lines(text: str, lang_hint: str = "ko") -> str:
-    ko_pats = [re.compile(p) for p in _KO_NOISE_PATTERNS]
-    en_pats = [re.compile(p) for p in _EN_NOISE_PATTERNS]
-    out = []
-    for ln in text.split("\n"):
-        ln = ln.strip()
-        if not ln:
-            continue
-        if _extract_article_no_safe(ln):
-            out.append(ln)
-            continue
-        pats = ko_pats if lang_hint == "ko" else en_pats
-        if not any(p.match(ln) for p in pats):
-            out.append(ln)
-    return "\n".join(out)
+# 문장 끝 판정용 접미사 (리플로우 호출마다 중첩 함수/튜플을 새로 만들지 않도록 모듈 상수로)
+_KO_SENT_ENDS = ("다", "라", "다.", "다,", "함", "임", "음")
+_EN_SENT_ENDS = (".", "!", "?", ":", ";", ")", '"', "'")
 
 
-def _reflow_ko(lines_text: str) -> str:
-    def ends_sentence(s: str) -> bool:
-        return s.endswith(("다", "라", "다.", "다,", "함", "임", "음"))
-    lines = lines_text.split("\n")
-    out, buf = [], ""
+def _reflow_ko(lines: List[str]) -> str:
+    # 이어붙일 조각을 리스트에 모았다가 경계에서 한 번만 join (문자열 반복 연결 회피)
+    # 조각은 비어 있지 않은 라인이므로 문장 끝 판정은 마지막 조각만 보면 된다
+    out: List[str] = []
+    buf_parts: List[str] = []
     for ln in lines:
-        if not buf:
-            buf = ln; continue
-        if (not ends_sentence(buf)) and ln and (ln[0] in "①②③④⑤⑥⑦⑧⑨⑩" or ln[0].islower()):
-            buf = buf + " " + ln
+        if not buf_parts:
+            buf_parts.append(ln); continue
+        if (not buf_parts[-1].endswith(_KO_SENT_ENDS)) and ln and (ln[0] in "①②③④⑤⑥⑦⑧⑨⑩" or ln[0].islower()):
+            buf_parts += (" ", ln)
         else:
-            out.append(buf); buf = ln
-    if buf:
-        out.append(buf)
+            out.append("".join(buf_parts)); buf_parts = [ln]
+    if buf_parts:
+        out.append("".join(buf_parts))
     return "\n".join(out).strip()
 
 
-def _reflow_en(lines_text: str) -> str:
-    def ends_sentence(s: str) -> bool:
-        return s.rstrip().endswith((".", "!", "?", ":", ";", ")", '"', "'"))
-    lines = lines_text.split("\n")
-    out, buf = [], ""
+def _reflow_en(lines: List[str]) -> str:
+    out: List[str] = []
+    buf_parts: List[str] = []
     for ln in lines:
-        if not buf:
-            buf = ln; continue
-        if buf.endswith("-") and ln and ln[0].islower():
-            buf = buf[:-1] + ln; continue
-        if (not ends_sentence(buf)) and ln and (ln[0].islower() or ln[0].isdigit()):
-            buf = buf + " " + ln
+        if not buf_parts:
+            buf_parts.append(ln); continue
+        last = buf_parts[-1]
+        if last.endswith("-") and ln and ln[0].islower():
+            buf_parts[-1] = last[:-1] + ln; continue
+        if (not last.rstrip().endswith(_EN_SENT_ENDS)) and ln and (ln[0].islower() or ln[0].isdigit()):
+            buf_parts += (" ", ln)
         else:
-            out.append(buf); buf = ln
-    if buf:
-        out.append(buf)
+            out.append("".join(buf_parts)); buf_parts = [ln]
+    if buf_parts:
+        out.append("".join(buf_parts))
     return "\n".join(out).strip()
 
 
 def normalize_article_text(raw_text: str, lang_hint: str = "ko") -> str:
-    t = _remove_noise_lines(raw_text, lang_hint=lang_hint)
-    t = _reflow_ko(t) if lang_hint == "ko" else _reflow_en(t)
+    return normalize_article_lines((raw_text,), lang_hint=lang_hint)
+
+
+def normalize_article_lines(lines: Iterable[str], lang_hint: str = "ko") -> str:
+    """
+    normalize_article_text와 같은 결과를 라인 리스트에서 바로 생성.
+    flush에서 라인을 개행으로 합쳤다가 노이즈 제거/리플로우에서 다시 쪼개는 과정을 생략한다.
+    """
+    ko = lang_hint == "ko"
+    kept: List[str] = []
+    for raw in lines:
+        for ln in (raw.split("\n") if "\n" in raw else (raw,)):
+            ln = ln.strip()
+            # 노이즈가 아니거나 조문 헤더인 라인만 유지
+            if ln and not (_is_noise_text(ln, ko) and not _extract_article_no_safe(ln)):
+                kept.append(ln)
+    t = _reflow_ko(kept) if lang_hint == "ko" else _reflow_en(kept)
     return t.strip()
 
 
+def _normalize_buffer_lines(lines: List[Dict[str, Any]], lang_hint: str) -> Optional[str]:
+    """
+    flush용: 라인 dict 리스트 → 정규화 텍스트.
+    기존 join(...).strip() or None 과 동일하게, 내용이 공백뿐이면 None.
+    """
+    texts = [l["text"] for l in lines]
+    if not any(t.strip() for t in texts):
+        return None
+    return normalize_article_lines(texts, lang_hint=lang_hint)
+
+
 # =========================
 # Article boundary helpers
 # =========================
 _RE_KO_ARTICLE_INBODY = re.compile(r"(?:^|\n)(제\s*\d+\s*조)(?:\s|①②③④⑤⑥⑦⑧⑨⑩|$|\(|\[|의|【|〔)")
+_RE_KO_TARGET_LABEL = re.compile(r"제(\d+)조")
 _RE_EN_ARTICLE_INBODY = re.compile(r"(?:^|\n)(Article\s*\(?\s*\d+\s*\)?\b)", re.IGNORECASE)
 
 
-def split_korean_constitution_blocks(text: str) -> List[Tuple[str, str]]:
+def _iter_article_blocks(text: str, matches: Iterator[re.Match]) -> Iterator[Tuple[str, str]]:
+    """
+    조문 마커 매치(텍스트 순서)로부터 (라벨, 블록)을 순서대로 생성. 10자 미만 블록은 건너뜀.
+    블록 끝은 다음 마커 위치이므로 한 칸 앞서 읽는다 — clamp는 대상 조문을 찾는 즉시 중단 가능.
+    """
+    m = next(matches, None)
+    while m is not None:
+        nxt = next(matches, None)
+        end = nxt.start(1) if nxt is not None else len(text)
+        block = text[m.start(1):end].strip()
+        if len(block) >= 10:
+            yield m.group(1).replace(" ", ""), block
+        m = nxt
+
+
+def _split_article_blocks(text: str, marker_re: re.Pattern) -> List[Tuple[str, str]]:
+    """한/영 공용 블록 분할. 마커가 하나도 없으면 전체를 라벨 없는 한 블록으로."""
     if not text:
         return []
-    markers = [(m.start(1), m.group(1)) for m in _RE_KO_ARTICLE_INBODY.finditer(text)]
+    # finditer는 텍스트 순서대로 매치를 돌려주므로 별도 정렬 불필요
+    markers = list(marker_re.finditer(text))
     if not markers:
         return [("", text.strip())]
-    markers.sort(key=lambda x: x[0])
-    blocks = []
-    for i, (pos, label) in enumerate(markers):
-        end = markers[i + 1][0] if i + 1 < len(markers) else len(text)
-        block = text[pos:end].strip()
-        if len(block) >= 10:
-            blocks.append((label.replace(" ", ""), block))
-    return blocks
+    return list(_iter_article_blocks(text, iter(markers)))
+
+
+def split_korean_constitution_blocks(text: str) -> List[Tuple[str, str]]:
+    return _split_article_blocks(text, _RE_KO_ARTICLE_INBODY)
+
+
+@lru_cache(maxsize=1024)
+def _ko_label_marker_re(article_no: str) -> re.Pattern:
+    """특정 조문 번호("제N조")의 본문 내 마커만 찾는 패턴 (_RE_KO_ARTICLE_INBODY의 부분집합)."""
+    return re.compile(
+        rf"(?:^|\n)제\s*{re.escape(article_no)}\s*조(?:\s|①②③④⑤⑥⑦⑧⑨⑩|$|\(|\[|의|【|〔)"
+    )
 
 
 def clamp_to_single_article(text: str, target_label: str) -> str:
     if not text or not target_label:
         return text.strip() if text else ""
     target_label = target_label.replace(" ", "")
-    blocks = split_korean_constitution_blocks(text)
-    for label, block in blocks:
-        if label.replace(" ", "") == target_label:
+    # 대상 조문 마커가 본문에 아예 없으면 블록 분할 없이 바로 반환 (결과는 분할 후 미일치와 동일)
+    m_label = _RE_KO_TARGET_LABEL.fullmatch(target_label)
+    if m_label and _ko_label_marker_re(m_label.group(1)).search(text) is None:
+        return text.strip()
+    # 전체 블록 목록을 만들지 않고 대상 조문까지만 순회 (마커가 없으면 아래 fallback과 동일)
+    for label, block in _iter_article_blocks(text, _RE_KO_ARTICLE_INBODY.finditer(text)):
+        if label == target_label:
             return block.strip()
     return text.strip()
 
 
 def split_english_constitution_blocks(text: str) -> List[Tuple[str, str]]:
-    if not text:
-        return []
-    markers = [(m.start(1), m.group(1)) for m in _RE_EN_ARTICLE_INBODY.finditer(text)]
-    if not markers:
-        return [("", text.strip())]
-    markers.sort(key=lambda x: x[0])
-    blocks = []
-    for i, (pos, label) in enumerate(markers):
-        end = markers[i + 1][0] if i + 1 < len(markers) else len(text)
-        block = text[pos:end].strip()
-        if len(block) >= 10:
-            blocks.append((label.replace(" ", ""), block))
-    return blocks
+    return _split_article_blocks(text, _RE_EN_ARTICLE_INBODY)
 
 
 def clamp_to_single_article_en(text: str, target_article_no: str) -> str:
     if not text or not target_article_no:
         return text.strip() if text else ""
-    blocks = split_english_constitution_blocks(text)
     target_num = str(target_article_no).strip()
-    for label, block in blocks:
-        nums = re.findall(r"\d+", label)
-        if nums and nums[0] == target_num:
+    for label, block in _iter_article_blocks(text, _RE_EN_ARTICLE_INBODY.finditer(text)):
+        m_num = _RE_DIGITS.search(label)
+        if m_num and m_num.group() == target_num:
             return block.strip()
     return text.strip()
 
@@ -741,6 +1076,53 @@ def _pick_header_rect(
     return min(candidates, key=lambda r: r.y0)
 
 
+# 앵커 검색용 TextPage 캐시 크기 (flush는 문서 순서대로 진행되므로 최근 몇 페이지면 충분)
+_ANCHOR_TEXTPAGE_CACHE_MAX = 4
+
+
+def _page_with_textpage(
+    doc: fitz.Document,
+    pidx: int,
+    cache: Optional[Dict[int, Tuple[fitz.Page, fitz.TextPage]]],
+) -> Tuple[fitz.Page, Optional[fitz.TextPage]]:
+    """
+    search_for용 (page, TextPage). 캐시가 있으면 페이지당 TextPage를 한 번만 만들어 재사용
+    (search_for(textpage=None)은 호출마다 페이지 텍스트를 다시 추출함).
+    TextPage는 search_for 기본 flags로 생성해 결과를 동일하게 유지.
+    """
+    if cache is None:
+        return doc[pidx], None
+    hit = cache.get(pidx)
+    if hit is None:
+        page = doc[pidx]
+        tp = page.get_textpage(flags=_SEARCH_TEXT_FLAGS)
+        if len(cache) >= _ANCHOR_TEXTPAGE_CACHE_MAX:
+            del cache[next(iter(cache))]  # 가장 먼저 넣은 페이지부터 제거
+        hit = cache[pidx] = (page, tp)
+    return hit
+
+
+def _search_page_cached(
+    page: fitz.Page,
+    textpage: Optional[fitz.TextPage],
+    pidx: int,
+    pat: str,
+    search_cache: Optional[Dict[Tuple[int, str], List[fitz.Rect]]],
+) -> List[fitz.Rect]:
+    """
+    page.search_for 결과를 (페이지, 패턴) 단위로 재사용.
+    같은 조의 항 청크들은 같은 헤더 패턴을 같은 후보 페이지에서 반복 검색하므로 첫 결과를 보관
+    (반환된 Rect는 읽기 전용으로만 사용).
+    """
+    if search_cache is None:
+        return page.search_for(pat, textpage=textpage)
+    key = (pidx, pat)
+    rects = search_cache.get(key)
+    if rects is None:
+        rects = search_cache[key] = page.search_for(pat, textpage=textpage)
+    return rects
+
+
 def _anchor_bbox_by_article_header(
     doc: fitz.Document,
     *,
@@ -749,6 +1131,8 @@ def _anchor_bbox_by_article_header(
     lang_hint: str,
     body_acc: Optional[Dict[int, Dict[str, float]]] = None,
     page_height_map: Optional[Dict[int, float]] = None,  # ★ v4.1
+    textpage_cache: Optional[Dict[int, Tuple[fitz.Page, fitz.TextPage]]] = None,
+    search_cache: Optional[Dict[Tuple[int, str], List[fitz.Rect]]] = None,
 ) -> List[Dict[str, Any]]:
     if not article_no or not prefer_pages_1based:
         return []
@@ -766,12 +1150,12 @@ def _anchor_bbox_by_article_header(
         pidx = max(0, int(p1) - 1)
         if pidx >= len(doc):
             continue
-        page = doc[pidx]
+        page, textpage = _page_with_textpage(doc, pidx, textpage_cache)
         page_height = page.rect.height
         header_page = int(p1)
 
         for pat in patterns:
-            rects = page.search_for(pat)
+            rects = _search_page_cached(page, textpage, pidx, pat, search_cache)
             if not rects:
                 continue
             r = _pick_header_rect(rects, body_acc, header_page, page_height)
@@ -779,7 +1163,8 @@ def _anchor_bbox_by_article_header(
                 continue
             if body_acc:
                 if header_page in body_acc:
-                    merged_acc = deepcopy(body_acc)
+                    merged_acc = {pg: dict(u) for pg, u in body_acc.items()}
+                    # 내부 dict는 float 좌표뿐이라 deepcopy 대신 한 단계 복사로 충분
                     # ★ v4.1: page_height 전달
                     ph = (page_height_map or {}).get(header_page, page_height)
                     _accum_bbox(merged_acc, page_no=header_page,
@@ -793,7 +1178,7 @@ def _anchor_bbox_by_article_header(
                      "x1": float(r.x1), "y1": float(r.y1)}]
 
         for pat in fallback_patterns:
-            rects = page.search_for(pat)
+            rects = _search_page_cached(page, textpage, pidx, pat, search_cache)
             if not rects:
                 continue
             r = _pick_header_rect(rects, body_acc, header_page, page_height)
@@ -801,7 +1186,7 @@ def _anchor_bbox_by_article_header(
                 continue
             if body_acc:
                 if header_page in body_acc:
-                    merged_acc = deepcopy(body_acc)
+                    merged_acc = {pg: dict(u) for pg, u in body_acc.items()}
                     ph = (page_height_map or {}).get(header_page, page_height)
                     _accum_bbox(merged_acc, page_no=header_page,
                                 bbox=fitz.Rect(r.x0, r.y0, r.x1, r.y1),
@@ -819,11 +1204,12 @@ def _anchor_bbox_by_article_header(
 # =========================
 # ★ v4.0: 조 단위 누적 버퍼
 # =========================
-@dataclass
+@dataclass(slots=True)
 class _ArticleBuffer:
     """
     조 단위 청킹 모드("article")에서 사용.
     항 단위로 쌓인 청크들을 하나의 조 청크로 합치기 위한 버퍼.
+    flush 때마다 새로 만들지 않고 같은 객체를 reset()으로 재사용.
     """
     article_no: Optional[str] = None
     en_lines: List[Dict[str, Any]] = field(default_factory=list)
@@ -838,6 +1224,70 @@ class _ArticleBuffer:
     col_lang_hint: Optional[str] = None
     structure_context: Dict[str, Any] = field(default_factory=dict)
 
+    def reset(self) -> None:
+        # 새 _ArticleBuffer() 와 같은 상태로. 컨테이너는 비워서 재사용
+        # (flush가 텍스트/bbox/structure를 모두 새 객체로 복사해 가므로 청크와 공유되지 않음)
+        self.article_no = None
+        self.en_lines.clear()
+        self.ko_lines.clear()
+        self.page = None
+        self.page_en = None
+        self.page_ko = None
+        self.page_english = None
+        self.page_korean = None
+        self.bbox_acc.clear()
+        self.col_lang_hint = None
+        self.structure_context.clear()
+
+
+# =========================
+# 항 단위 누적 버퍼
+# =========================
+@dataclass(slots=True)
+class _ParagraphBuffer:
+    """
+    항 단위 청킹 모드("paragraph")에서 사용.
+    flush 때마다 dict를 새로 만들지 않고 같은 객체를 reset()으로 재사용.
+    """
+    article_no: Optional[str] = None
+    paragraph_no: Optional[str] = None
+    display_path: str = ""
+    structure: Dict[str, Any] = field(default_factory=dict)
+    en_lines: List[Dict[str, Any]] = field(default_factory=list)
+    ko_lines: List[Dict[str, Any]] = field(default_factory=list)
+    page: Optional[int] = None
+    page_en: Optional[int] = None
+    page_ko: Optional[int] = None
+    page_english: Optional[int] = None
+    page_korean: Optional[int] = None
+    para_bbox_acc: Dict[int, Dict[str, float]] = field(default_factory=dict)
+    col_lang_hint: Optional[str] = None
+    structure_context: Dict[str, Any] = field(default_factory=dict)
+
+    def reset(self) -> None:
+        # 구 _empty_current() 와 같은 상태로. 컨테이너는 새로 만들지 않고 비워서 재사용
+        # (flush가 텍스트/bbox/structure를 모두 새 객체로 복사해 가므로 청크와 공유되지 않음)
+        self.article_no = None
+        self.paragraph_no = None
+        self.display_path = ""
+        self.structure.clear()
+        self.en_lines.clear()
+        self.ko_lines.clear()
+        self.page = None
+        self.page_en = None
+        self.page_ko = None
+        self.page_english = None
+        self.page_korean = None
+        self.para_bbox_acc.clear()
+        self.col_lang_hint = None
+        self.structure_context.clear()
+
+
+def _is_tiny_chunk(ch: ConstitutionChunk) -> bool:
+    """본문 30자 미만이면서 조문 번호도 없는 청크 (결과에서 제외)."""
+    body = (ch.korean_text or "") + "\n" + (ch.english_text or "")
+    return len(body.strip()) < 30 and not (ch.structure or {}).get("article_number")
+
 
 # =========================
 # Main Chunker
@@ -851,6 +1301,8 @@ class ComparativeConstitutionChunker:
         auto_detect_columns: bool = True,
         # ★ v4.0: 청크 단위 ("article" | "paragraph")
         chunk_granularity: str = "paragraph",
+        # 페이지 추출 워커 프로세스 수 (1 = 순차 처리, 0 이하 = CPU 코어 수)
+        page_workers: Optional[int] = None,
     ):
         self.keep_only_body_pages = keep_only_body_pages
         self.body_score_threshold = body_score_threshold
@@ -863,6 +1315,15 @@ class ComparativeConstitutionChunker:
         if self.chunk_granularity not in ("article", "paragraph"):
             print(f"[Chunker] 경고: 알 수 없는 chunk_granularity='{self.chunk_granularity}'. 'paragraph'로 대체.")
             self.chunk_granularity = "paragraph"
+        if page_workers is None:
+            try:
+                page_workers = int(os.getenv("CONSTITUTION_PAGE_WORKERS", "1"))
+            except ValueError:
+                print("[Chunker] 경고: CONSTITUTION_PAGE_WORKERS 값이 정수가 아님. 순차 처리로 대체.")
+                page_workers = 1
+        if page_workers <= 0:
+            page_workers = os.cpu_count() or 1
+        self.page_workers = page_workers
 
     def chunk(
         self,
@@ -874,6 +1335,26 @@ class ComparativeConstitutionChunker:
         version: Optional[str] = None,
         is_bilingual: bool = False,
     ) -> List[ConstitutionChunk]:
+        return list(self.iter_chunks(
+            pdf_path,
+            doc_id=doc_id,
+            country=country,
+            constitution_title=constitution_title,
+            version=version,
+            is_bilingual=is_bilingual,
+        ))
+
+    def iter_chunks(
+        self,
+        pdf_path: str,
+        *,
+        doc_id: str,
+        country: str,
+        constitution_title: str,
+        version: Optional[str] = None,
+        is_bilingual: bool = False,
+    ) -> Iterator[ConstitutionChunk]:
+        """chunk()와 같은 청크를 완성되는 순서대로 하나씩 반환하는 제너레이터."""
 
         doc = fitz.open(pdf_path)
 
@@ -883,8 +1364,10 @@ class ComparativeConstitutionChunker:
             for pidx in range(len(doc))
         }
 
+        # 레이아웃 감지 표본 페이지의 단어 목록 (2단 추출 시 재사용)
+        words_cache: Dict[int, List[Tuple]] = {}
         if self.auto_detect_columns:
-            layout = _detect_column_layout(doc)
+            layout = _detect_column_layout(doc, words_cache=words_cache)
         else:
             layout = {
                 "is_two_column": self.assume_two_columns,
@@ -904,31 +1387,23 @@ class ComparativeConstitutionChunker:
         pages_meta: List[Dict[str, Any]] = []
         pages_col_lines: List[Optional[Tuple[List, List]]] = []
 
-        for pidx, page in enumerate(doc):
-            page_height = page.rect.height
-
-            if is_two_column:
-                page_col_mid = col_mid
-                left_lines, right_lines = _page_lines_two_column(
-                    page, col_mid=page_col_mid, col_gap=col_gap
-                )
-                left_lines = _strip_header_footer_lines(left_lines)
-                right_lines = _strip_header_footer_lines(right_lines)
-                left_lines = _filter_noise_lines(left_lines, page_height=page_height)
-                right_lines = _filter_noise_lines(right_lines, page_height=page_height)
-                all_lines = left_lines + right_lines
-                score = _page_quality_score(all_lines, country=country)
-                pages_lines.append(all_lines)
-                pages_col_lines.append((left_lines, right_lines))
-            else:
-                lines = _page_lines_single_column(page)
-                lines = _strip_header_footer_lines(lines)
-                lines = _filter_noise_lines(lines, page_height=page_height)
-                score = _page_quality_score(lines, country=country)
-                pages_lines.append(lines)
-                pages_col_lines.append(None)
+        if self.page_workers > 1 and len(doc) > 1:
+            page_results = _extract_pages_parallel(
+                pdf_path, len(doc), self.page_workers,
+                is_two_column, col_mid, col_gap,
+            )
+        else:
+            page_results = (
+                _extract_page(page, is_two_column, col_mid, col_gap,
+                              words=words_cache.pop(pidx, None))
+                for pidx, page in enumerate(doc)
+            )
 
-            pages_meta.append({"page_index": pidx, "page_no": pidx + 1, "score": score})
+        # 점수는 반복 엣지 제거 후 아래 선별 루프에서 한 번만 계산
+        for pidx, (lines, col_pair) in enumerate(page_results):
+            pages_lines.append(lines)
+            pages_col_lines.append(col_pair)
+            pages_meta.append({"page_index": pidx, "page_no": pidx + 1, "score": 0.0})
 
         # 반복 엣지 라인 제거
         top_rep, bot_rep = _detect_repeated_edge_lines(
@@ -937,45 +1412,45 @@ class ComparativeConstitutionChunker:
             bottom_k=2,
             thr=0.25
         )
-        pages_lines = _remove_repeated_edge_lines(pages_lines, top_rep, bot_rep)
-
-        cleaned_col_lines = []
-        for col_pair in pages_col_lines:
-            if col_pair is None:
-                cleaned_col_lines.append(None)
-            else:
-                left, right = col_pair
-                left_cleaned = [ln for ln in left if ln["text"] not in top_rep and ln["text"] not in bot_rep]
-                right_cleaned = [ln for ln in right if ln["text"] not in top_rep and ln["text"] not in bot_rep]
-                cleaned_col_lines.append((left_cleaned, right_cleaned))
-        pages_col_lines = cleaned_col_lines
-
-        for i in range(len(pages_meta)):
-            pages_meta[i]["score"] = _page_quality_score(pages_lines[i], country=country)
 
+        # 페이지당 한 번의 순회로: 반복 엣지 제거 → 컬럼 정리 → 재채점 → 본문 페이지 선별
+        # 컬럼 라인은 위치와 무관하게 제거하므로 두 집합을 한 번만 합쳐 조회
+        # (반복 엣지가 없으면 라인 리스트를 다시 만들지 않고 그대로 사용)
+        edge_rep = top_rep | bot_rep
         kept: List[Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[Tuple[List, List]]]] = []
         for meta, lines, col_pair in zip(pages_meta, pages_lines, pages_col_lines):
+            if edge_rep:
+                lines = _strip_repeated_edges(lines, top_rep, bot_rep)
             if not lines:
                 continue
-            if self.keep_only_body_pages:
-                if meta["score"] < self.body_score_threshold:
-                    continue
-                if sum(len(l["text"]) for l in lines) < 200:
-                    continue
+            if self.keep_only_body_pages and sum(len(l["text"]) for l in lines) < 200:
+                continue
+            meta["score"] = _page_quality_score(lines, country=country)
+            if self.keep_only_body_pages and meta["score"] < self.body_score_threshold:
+                continue
+            if col_pair is not None and edge_rep:
+                left, right = col_pair
+                col_pair = (
+                    [ln for ln in left if ln["text"] not in edge_rep],
+                    [ln for ln in right if ln["text"] not in edge_rep],
+                )
             kept.append((meta, lines, col_pair))
+        # 본문 점수 미달로 버려진 페이지의 라인은 청킹 전에 해제
+        # (병렬 추출 시 page_results 리스트도 모든 페이지 결과를 쥐고 있으므로 함께 해제)
+        del pages_lines, pages_col_lines, page_results
 
         # ──────────────────────────────────────────────
         # chunk_granularity 분기
         # ──────────────────────────────────────────────
         if self.chunk_granularity == "article":
-            return self._chunk_article_level(
+            yield from self._chunk_article_level(
                 doc, kept, doc_id=doc_id, country=country,
                 constitution_title=constitution_title, version=version,
                 is_two_column=is_two_column,
                 page_height_map=page_height_map,  # ★ v4.1
             )
         else:
-            return self._chunk_paragraph_level(
+            yield from self._chunk_paragraph_level(
                 doc, kept, doc_id=doc_id, country=country,
                 constitution_title=constitution_title, version=version,
                 is_two_column=is_two_column,
@@ -996,47 +1471,45 @@ class ComparativeConstitutionChunker:
         version: Optional[str],
         is_two_column: bool,
         page_height_map: Dict[int, float],  # ★ v4.1
-    ) -> List[ConstitutionChunk]:
+    ) -> Iterator[ConstitutionChunk]:
         """
-        조(條) 단위 청킹.
+        조(條) 단위 청킹. 페이지 단위로 완성된 청크를 바로 내보낸다.
         """
-        chunks: List[ConstitutionChunk] = []
+        chunks: List[ConstitutionChunk] = []  # 아직 내보내지 않은 청크
         seq = 0
+        emitted = 0
+
+        def _accept(ch: ConstitutionChunk) -> None:
+            if not _is_tiny_chunk(ch):
+                chunks.append(ch)
 
         buf = _ArticleBuffer()
         article_bbox_acc: Dict[int, Dict[str, float]] = {}
         structure_context: Dict[str, Any] = {}
 
         def _flush_article():
-            nonlocal seq, buf, article_bbox_acc
+            nonlocal seq
 
             en_lines = buf.en_lines
             ko_lines = buf.ko_lines
             if not en_lines and not ko_lines:
-                buf = _ArticleBuffer()
-                article_bbox_acc = {}
+                buf.reset()
+                article_bbox_acc.clear()
                 return
 
-            en_text = "\n".join(l["text"] for l in en_lines).strip() or None
-            ko_text = "\n".join(l["text"] for l in ko_lines).strip() or None
             art_no = buf.article_no
-
+            ko_text = _normalize_buffer_lines(ko_lines, "ko")
+            en_text = _normalize_buffer_lines(en_lines, "en")
             if ko_text and art_no:
-                ko_text = normalize_article_text(ko_text, lang_hint="ko")
                 ko_text = clamp_to_single_article(ko_text, target_label=f"제{art_no}조")
-            elif ko_text:
-                ko_text = normalize_article_text(ko_text, lang_hint="ko")
             if en_text and art_no:
-                en_text = normalize_article_text(en_text, lang_hint="en")
                 en_text = clamp_to_single_article_en(en_text, target_article_no=art_no)
-            elif en_text:
-                en_text = normalize_article_text(en_text, lang_hint="en")
 
             has_en = bool(en_text)
             has_ko = bool(ko_text)
             if not has_en and not has_ko:
-                buf = _ArticleBuffer()
-                article_bbox_acc = {}
+                buf.reset()
+                article_bbox_acc.clear()
                 return
 
             if has_en and has_ko:
@@ -1050,11 +1523,10 @@ class ComparativeConstitutionChunker:
                 search_text = ko_text
 
             lang_hint = buf.col_lang_hint if buf.col_lang_hint else ("KO" if has_ko else "EN")
-            prefer_pages = []
-            for k in ["page", "page_ko", "page_en", "page_korean", "page_english"]:
-                v = getattr(buf, k, None)
-                if v and int(v) not in prefer_pages:
-                    prefer_pages.append(int(v))
+            # 순서 유지 중복 제거 (dict 키 해시 조회)
+            prefer_pages = list(dict.fromkeys(
+                int(v) for v in (buf.page, buf.page_ko, buf.page_en, buf.page_korean, buf.page_english) if v
+            ))
 
             art_boxes = _acc_to_boxes(article_bbox_acc)
             if art_boxes:
@@ -1067,31 +1539,30 @@ class ComparativeConstitutionChunker:
             if buf.structure_context:
                 structure.update(buf.structure_context)
 
-            chunks.append(
-                ConstitutionChunk(
-                    doc_id=doc_id,
-                    country=country,
-                    constitution_title=constitution_title,
-                    version=version,
-                    seq=seq,
-                    page=buf.page or 1,
-                    page_english=buf.page_en or buf.page_english,
-                    page_korean=buf.page_ko or buf.page_korean,
-                    display_path=display_path,
-                    structure=structure,
-                    english_text=en_text,
-                    korean_text=ko_text,
-                    has_english=has_en,
-                    has_korean=has_ko,
-                    text_type=text_type,
-                    search_text=search_text,
-                    bbox_info=bbox_info,
-                    article_bbox_info=art_boxes,
-                )
+            ch = ConstitutionChunk(
+                doc_id=doc_id,
+                country=country,
+                constitution_title=constitution_title,
+                version=version,
+                seq=seq,
+                page=buf.page or 1,
+                page_english=buf.page_en or buf.page_english,
+                page_korean=buf.page_ko or buf.page_korean,
+                display_path=display_path,
+                structure=structure,
+                english_text=en_text,
+                korean_text=ko_text,
+                has_english=has_en,
+                has_korean=has_ko,
+                text_type=text_type,
+                search_text=search_text,
+                bbox_info=bbox_info,
+                article_bbox_info=art_boxes,
             )
             seq += 1
-            buf = _ArticleBuffer()
-            article_bbox_acc = {}
+            _accept(ch)
+            buf.reset()
+            article_bbox_acc.clear()
 
         structure_context: Dict[str, Any] = {}
 
@@ -1099,9 +1570,7 @@ class ComparativeConstitutionChunker:
             t = text.strip()
             if not t or _extract_article_no_safe(t):
                 return None
-            m = re.match(
-                r"^제?\s*[\dIVXivx이일이삼사오육칠팔구십]+\s*(편|부|장|절|관)\s*.{0,40}$", t
-            )
+            m = _RE_STRUCT_HEADER.match(t)
             if m:
                 return m.group(1)
             return None
@@ -1122,8 +1591,6 @@ class ComparativeConstitutionChunker:
 
         def _process_line_article(ln: Dict[str, Any], page_no: int, lang_hint_default: str = "KO"):
             """조 단위 모드: 라인을 현재 조 버퍼에 누적. 조 경계에서만 flush."""
-            nonlocal article_bbox_acc
-
             text = ln["text"]
             bbox = ln.get("bbox")
             # ★ v4.1: 라인에 저장된 page_height 우선, 없으면 맵에서 조회
@@ -1132,13 +1599,13 @@ class ComparativeConstitutionChunker:
             if _update_struct_ctx(text):
                 return
 
-            art = _extract_article_no_safe(text)
+            art, art_lang = _extract_article_no_lang(text)
             if art:
                 _flush_article()
                 buf.article_no = art
                 buf.page = page_no
                 buf.structure_context = dict(structure_context)
-                lh = "KO" if RE_KO_ARTICLE.match(text.lstrip()) else lang_hint_default
+                lh = "KO" if art_lang == "KO" else lang_hint_default
                 buf.col_lang_hint = lh
 
                 if bbox is not None:
@@ -1156,8 +1623,6 @@ class ComparativeConstitutionChunker:
                         buf.en_lines.append(fake_ln)
                         buf.page_en = buf.page_en or page_no
                         buf.page_english = buf.page_english or page_no
-                    if bbox is not None:
-                        _accum_bbox(article_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
                 return
 
             if _has_hangul(text):
@@ -1174,56 +1639,57 @@ class ComparativeConstitutionChunker:
             if bbox is not None:
                 _accum_bbox(article_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
 
-        for meta, lines, col_pair in kept:
-            page_no = meta["page_no"]
+        try:
+            for meta, lines, col_pair in kept:
+                page_no = meta["page_no"]
 
-            if not is_two_column or col_pair is None:
-                for ln in lines:
-                    _process_line_article(ln, page_no)
-            else:
-                left_lines, right_lines = col_pair
-                left_total = max(len(left_lines), 1)
-                right_total = max(len(right_lines), 1)
-                left_ko_ratio = sum(1 for ln in left_lines if _has_hangul(ln["text"])) / left_total
-                right_ko_ratio = sum(1 for ln in right_lines if _has_hangul(ln["text"])) / right_total
-
-                both_ko = left_ko_ratio >= 0.6 and right_ko_ratio >= 0.6
-                neither_ko = left_ko_ratio < 0.3 and right_ko_ratio < 0.3
-                is_newspaper = both_ko or neither_ko
-
-                if is_newspaper:
-                    for ln in left_lines + right_lines:
+                if not is_two_column or col_pair is None:
+                    for ln in lines:
                         _process_line_article(ln, page_no)
                 else:
-                    if left_ko_ratio >= right_ko_ratio:
-                        ko_col, foreign_col = left_lines, right_lines
+                    left_lines, right_lines = col_pair
+                    left_total = max(len(left_lines), 1)
+                    right_total = max(len(right_lines), 1)
+                    left_ko_ratio = sum(1 for ln in left_lines if _has_hangul(ln["text"])) / left_total
+                    right_ko_ratio = sum(1 for ln in right_lines if _has_hangul(ln["text"])) / right_total
+
+                    both_ko = left_ko_ratio >= 0.6 and right_ko_ratio >= 0.6
+                    neither_ko = left_ko_ratio < 0.3 and right_ko_ratio < 0.3
+                    is_newspaper = both_ko or neither_ko
+
+                    if is_newspaper:
+                        for ln in left_lines + right_lines:
+                            _process_line_article(ln, page_no)
                     else:
-                        ko_col, foreign_col = right_lines, left_lines
+                        if left_ko_ratio >= right_ko_ratio:
+                            ko_col, foreign_col = left_lines, right_lines
+                        else:
+                            ko_col, foreign_col = right_lines, left_lines
 
-                    for ln in ko_col:
-                        _process_line_article(ln, page_no, lang_hint_default="KO")
+                        for ln in ko_col:
+                            _process_line_article(ln, page_no, lang_hint_default="KO")
 
-                    for ln in foreign_col:
-                        text = ln["text"]
-                        if _extract_article_no_safe(text):
-                            continue
-                        buf.en_lines.append(ln)
-                        buf.page_en = buf.page_en or page_no
-                        buf.page_english = buf.page_english or page_no
+                        for ln in foreign_col:
+                            text = ln["text"]
+                            if _extract_article_no_safe(text):
+                                continue
+                            buf.en_lines.append(ln)
+                            buf.page_en = buf.page_en or page_no
+                            buf.page_english = buf.page_english or page_no
 
-        _flush_article()
-        doc.close()
+                # 이 페이지까지 완성된 청크 방출
+                if chunks:
+                    emitted += len(chunks)
+                    yield from chunks
+                    chunks.clear()
 
-        cleaned: List[ConstitutionChunk] = []
-        for ch in chunks:
-            body = (ch.korean_text or "") + "\n" + (ch.english_text or "")
-            if len(body.strip()) < 30:
-                if not (ch.structure or {}).get("article_number"):
-                    continue
-            cleaned.append(ch)
+            _flush_article()
+            emitted += len(chunks)
+            yield from chunks
+        finally:
+            doc.close()
 
-        print(f"[Chunker] v4.1 조 단위 청크 {len(cleaned)}개 생성")
-        return cleaned
+        print(f"[Chunker] v4.1 조 단위 청크 {emitted}개 생성")
 
     # ──────────────────────────────────────────────────────────────
     # 항 단위 청킹 (v3.12 로직 + v4.1 bbox clamp)
@@ -1239,32 +1705,41 @@ class ComparativeConstitutionChunker:
         version: Optional[str],
         is_two_column: bool,
         page_height_map: Dict[int, float],  # ★ v4.1
-    ) -> List[ConstitutionChunk]:
+    ) -> Iterator[ConstitutionChunk]:
         """항(項) 단위 청킹 (v3.12 로직 + v4.1 bbox clamp)."""
 
+        # 아직 내보내지 않은 청크. 마지막 청크는 뒤따르는 짧은 청크가 병합될 수 있어 항상 보류한다.
         chunks: List[ConstitutionChunk] = []
         seq = 0
+        emitted = 0
 
-        def _empty_current() -> Dict[str, Any]:
-            return {
-                "article_no":   None,
-                "paragraph_no": None,
-                "display_path": "",
-                "structure":    {},
-                "en_lines":     [],
-                "ko_lines":     [],
-                "page":         None,
-                "page_en":      None,
-                "page_ko":      None,
-                "page_english": None,
-                "page_korean":  None,
-                "para_bbox_acc": {},
-                "col_lang_hint": None,
-                "structure_context": {},
-            }
+        def _accept(ch: ConstitutionChunk) -> None:
+            if _is_tiny_chunk(ch):
+                return
+            text = (ch.korean_text or ch.english_text or "").strip()
+            has_article = bool((ch.structure or {}).get("article_number"))
+            if chunks and (not has_article) and len(text) <= 40:
+                prev = chunks[-1]
+                if ch.korean_text and prev.korean_text:
+                    prev.korean_text = (prev.korean_text.rstrip() + " " + ch.korean_text.lstrip()).strip()
+                elif ch.english_text and prev.english_text:
+                    prev.english_text = (prev.english_text.rstrip() + " " + ch.english_text.lstrip()).strip()
+                prev.search_text = (prev.search_text.rstrip() + "\n" + text).strip()
+                if ch.bbox_info:
+                    prev.bbox_info = _union_bbox_info(
+                        (prev.bbox_info or []) + ch.bbox_info, pad_x=2.0, pad_y=1.5)
+                if ch.article_bbox_info:
+                    prev.article_bbox_info = _union_bbox_info(
+                        (prev.article_bbox_info or []) + ch.article_bbox_info, pad_x=3.0, pad_y=2.5)
+                return
+            chunks.append(ch)
 
-        current: Dict[str, Any] = _empty_current()
+        current = _ParagraphBuffer()
         article_bbox_acc: Dict[int, Dict[str, float]] = {}
+        # 헤더 앵커 검색용 페이지별 TextPage (같은 페이지의 조문들이 재사용)
+        anchor_textpages: Dict[int, Tuple[fitz.Page, fitz.TextPage]] = {}
+        # (페이지, 헤더 패턴) → search_for 결과 (같은 조의 항들이 같은 검색을 반복)
+        anchor_searches: Dict[Tuple[int, str], List[fitz.Rect]] = {}
 
         def _make_bbox_info(
             para_acc: Dict[int, Dict[str, float]],
@@ -1282,6 +1757,8 @@ class ComparativeConstitutionChunker:
                     lang_hint=lang_hint,
                     body_acc=para_acc if para_acc else None,
                     page_height_map=page_height_map,  # ★ v4.1
+                    textpage_cache=anchor_textpages,
+                    search_cache=anchor_searches,
                 )
                 bbox_info = anchored if anchored else _acc_to_boxes(para_acc)
             else:
@@ -1298,29 +1775,22 @@ class ComparativeConstitutionChunker:
             return bbox_info, art_boxes
 
         def flush():
-            nonlocal seq, current
-            if not current["en_lines"] and not current["ko_lines"]:
+            nonlocal seq
+            if not current.en_lines and not current.ko_lines:
                 return
 
-            en_text = "\n".join(l["text"] for l in current["en_lines"]).strip() or None
-            ko_text = "\n".join(l["text"] for l in current["ko_lines"]).strip() or None
-            art_no = current.get("article_no")
-
+            art_no = current.article_no
+            ko_text = _normalize_buffer_lines(current.ko_lines, "ko")
+            en_text = _normalize_buffer_lines(current.en_lines, "en")
             if ko_text and art_no:
-                ko_text = normalize_article_text(ko_text, lang_hint="ko")
                 ko_text = clamp_to_single_article(ko_text, target_label=f"제{art_no}조")
-            elif ko_text:
-                ko_text = normalize_article_text(ko_text, lang_hint="ko")
             if en_text and art_no:
-                en_text = normalize_article_text(en_text, lang_hint="en")
                 en_text = clamp_to_single_article_en(en_text, target_article_no=art_no)
-            elif en_text:
-                en_text = normalize_article_text(en_text, lang_hint="en")
 
             has_en = bool(en_text)
             has_ko = bool(ko_text)
             if not has_en and not has_ko:
-                current.update(_empty_current())
+                current.reset()
                 return
 
             if has_en and has_ko:
@@ -1333,61 +1803,58 @@ class ComparativeConstitutionChunker:
                 text_type = "korean_only"
                 search_text = ko_text
 
-            col_lang_hint = current.get("col_lang_hint")
+            col_lang_hint = current.col_lang_hint
             lang_hint = col_lang_hint if col_lang_hint else ("KO" if has_ko else "EN")
-            prefer_pages = []
-            for k in ["page", "page_ko", "page_en", "page_korean", "page_english"]:
-                v = current.get(k)
-                if v and int(v) not in prefer_pages:
-                    prefer_pages.append(int(v))
+            # 순서 유지 중복 제거 (dict 키 해시 조회)
+            prefer_pages = list(dict.fromkeys(
+                int(v) for v in (current.page, current.page_ko, current.page_en,
+                                 current.page_korean, current.page_english) if v
+            ))
 
             bbox_info, article_bbox_info = _make_bbox_info(
-                current["para_bbox_acc"], art_no, lang_hint, prefer_pages
+                current.para_bbox_acc, art_no, lang_hint, prefer_pages
             )
 
-            if not current.get("paragraph_no") and not article_bbox_info:
+            if not current.paragraph_no and not article_bbox_info:
                 article_bbox_info = bbox_info
 
-            paragraph_no = current.get("paragraph_no")
+            paragraph_no = current.paragraph_no
             display_path = _build_display_path(art_no or "?", lang_hint, paragraph=paragraph_no)
             structure: Dict[str, Any] = {"article_number": art_no} if art_no else {}
             if paragraph_no:
                 structure["paragraph"] = paragraph_no
-            if current.get("structure_context"):
-                structure.update(current["structure_context"])
-
-            chunks.append(
-                ConstitutionChunk(
-                    doc_id=doc_id,
-                    country=country,
-                    constitution_title=constitution_title,
-                    version=version,
-                    seq=seq,
-                    page=current["page"] or 1,
-                    page_english=current["page_en"] or current["page_english"],
-                    page_korean=current["page_ko"] or current["page_korean"],
-                    display_path=display_path,
-                    structure=structure,
-                    english_text=en_text,
-                    korean_text=ko_text,
-                    has_english=has_en,
-                    has_korean=has_ko,
-                    text_type=text_type,
-                    search_text=search_text,
-                    bbox_info=bbox_info,
-                    article_bbox_info=article_bbox_info,
-                )
+            if current.structure_context:
+                structure.update(current.structure_context)
+
+            ch = ConstitutionChunk(
+                doc_id=doc_id,
+                country=country,
+                constitution_title=constitution_title,
+                version=version,
+                seq=seq,
+                page=current.page or 1,
+                page_english=current.page_en or current.page_english,
+                page_korean=current.page_ko or current.page_korean,
+                display_path=display_path,
+                structure=structure,
+                english_text=en_text,
+                korean_text=ko_text,
+                has_english=has_en,
+                has_korean=has_ko,
+                text_type=text_type,
+                search_text=search_text,
+                bbox_info=bbox_info,
+                article_bbox_info=article_bbox_info,
             )
             seq += 1
-            current.update(_empty_current())
+            _accept(ch)
+            current.reset()
 
         def _is_struct_header(text: str) -> Optional[str]:
             t = text.strip()
             if not t or _extract_article_no_safe(t):
                 return None
-            m = re.match(
-                r"^제?\s*[\dIVXivx이일이삼사오육칠팔구십]+\s*(편|부|장|절|관)\s*.{0,40}$", t
-            )
+            m = _RE_STRUCT_HEADER.match(t)
             if m:
                 return m.group(1)
             return None
@@ -1395,10 +1862,12 @@ class ComparativeConstitutionChunker:
         def _process_lines_single(lines_seq, lang_hint_default="KO"):
             for ln in lines_seq:
                 text = ln["text"]
-                cleaned = re.sub(r"법제처\s*\d*\s*(?:국가법령정보센터)?\s*", "", text).strip()
-                if not cleaned:
-                    continue  # 함수가 아닌 루프이므로 continue
-                if cleaned != text:
+                # 라인 텍스트는 이미 정규화(strip)되어 있으므로 표기가 없으면 치환 불필요.
+                # 컬럼 경계에 걸친 라인은 좌/우 컬럼이 같은 dict를 공유하므로 바뀐 라인만 복사.
+                if "법제처" in text:
+                    cleaned = _RE_LAW_STAMP.sub("", text).strip()
+                    if not cleaned:
+                        continue  # 함수가 아닌 루프이므로 continue
                     ln = dict(ln, text=cleaned)
                     text = cleaned
                 bbox = ln.get("bbox")
@@ -1407,233 +1876,222 @@ class ComparativeConstitutionChunker:
 
                 struct_level = _is_struct_header(text)
                 if struct_level:
-                    current["structure_context"][struct_level] = text.strip()
+                    current.structure_context[struct_level] = text.strip()
                     level_order = ["편", "부", "장", "절", "관"]
                     if struct_level in level_order:
                         idx = level_order.index(struct_level)
                         for lower in level_order[idx + 1:]:
-                            current["structure_context"].pop(lower, None)
+                            current.structure_context.pop(lower, None)
                     continue
 
-                art = _extract_article_no_safe(text)
+                art, art_lang = _extract_article_no_lang(text)
                 if art:
                     flush()
                     article_bbox_acc.clear()
-                    current["article_no"] = art
-                    current["paragraph_no"] = None
-                    current["page"] = page_no
-                    lh = "KO" if RE_KO_ARTICLE.match(text.lstrip()) else lang_hint_default
-                    current["col_lang_hint"] = lh
-                    current["display_path"] = _build_display_path(art, lh)
-                    current["structure"] = {"article_number": art}
+                    current.article_no = art
+                    current.paragraph_no = None
+                    current.page = page_no
+                    lh = "KO" if art_lang == "KO" else lang_hint_default
+                    current.col_lang_hint = lh
+                    current.display_path = _build_display_path(art, lh)
+                    current.structure = {"article_number": art}
                     if bbox is not None:
-                        _accum_bbox(article_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
-                        _accum_bbox(current["para_bbox_acc"], page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
+                        # 조/항 누적 모두 같은 bbox이므로 clamp는 한 번만
+                        box = _clamp_bbox(bbox, page_no=page_no, page_height=ph)  # ★ v4.1
+                        if box is not None:
+                            _union_box(article_bbox_acc, page_no, box)
+                            _union_box(current.para_bbox_acc, page_no, box)
                     remainder = _extract_body_after_article_no(text, art)
                     if remainder:
                         fake_ln = dict(ln, text=remainder)
                         if _has_hangul(remainder):
-                            buf_ko = current["ko_lines"]
+                            buf_ko = current.ko_lines
                             buf_ko.append(fake_ln)
-                            current["page_ko"] = current["page_ko"] or page_no
-                            current["page_korean"] = current["page_korean"] or page_no
+                            current.page_ko = current.page_ko or page_no
+                            current.page_korean = current.page_korean or page_no
                         else:
-                            current["en_lines"].append(fake_ln)
-                            current["page_en"] = current["page_en"] or page_no
-                            current["page_english"] = current["page_english"] or page_no
+                            current.en_lines.append(fake_ln)
+                            current.page_en = current.page_en or page_no
+                            current.page_english = current.page_english or page_no
                     continue
 
                 para_key: Optional[str] = None
                 cm = _RE_CIRCLED.search(text)
                 if cm:
                     para_key = cm.group(0)
-                elif current["article_no"]:
-                    m_num = re.match(r"^(\d+)\s+", text)
+                elif current.article_no:
+                    m_num = _RE_LEAD_NUM.match(text) if text[:1].isdecimal() else None
                     if m_num and 1 <= int(m_num.group(1)) <= 20:
                         para_key = m_num.group(1)
 
                 if para_key:
-                    art_no_saved = current.get("article_no")
+                    art_no_saved = current.article_no
                     flush()
-                    current["article_no"] = art_no_saved
-                    current["paragraph_no"] = para_key
-                    current["page"] = page_no
-                    current["structure"] = {
+                    current.article_no = art_no_saved
+                    current.paragraph_no = para_key
+                    current.page = page_no
+                    current.structure = {
                         "article_number": art_no_saved,
                         "paragraph": para_key,
                     }
 
                 if _has_hangul(text):
-                    current["ko_lines"].append(ln)
-                    current["page_ko"] = current["page_ko"] or page_no
-                    current["page_korean"] = current["page_korean"] or page_no
+                    current.ko_lines.append(ln)
+                    current.page_ko = current.page_ko or page_no
+                    current.page_korean = current.page_korean or page_no
                 else:
-                    current["en_lines"].append(ln)
-                    current["page_en"] = current["page_en"] or page_no
-                    current["page_english"] = current["page_english"] or page_no
+                    current.en_lines.append(ln)
+                    current.page_en = current.page_en or page_no
+                    current.page_english = current.page_english or page_no
 
-                current["page"] = current["page"] or page_no
+                current.page = current.page or page_no
 
                 if bbox is not None:
-                    _accum_bbox(current["para_bbox_acc"], page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
+                    _accum_bbox(current.para_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
 
-        for meta, lines, col_pair in kept:
-            page_no = meta["page_no"]
+        try:
+            for meta, lines, col_pair in kept:
+                page_no = meta["page_no"]
 
-            if not is_two_column or col_pair is None:
-                # 1단
-                for ln in lines:
-                    text = ln["text"]
-                    cleaned = re.sub(r"법제처\s*\d*\s*(?:국가법령정보센터)?\s*", "", text).strip()
-                    if not cleaned:
-                        continue  # 함수가 아닌 루프이므로 continue
-                    if cleaned != text:
-                        ln = dict(ln, text=cleaned)
-                        text = cleaned
-                    bbox = ln.get("bbox")
-                    # ★ v4.1: page_height 조회
-                    ph = ln.get("page_height") or page_height_map.get(page_no, 0.0)
-
-                    struct_level = _is_struct_header(text)
-                    if struct_level:
-                        current["structure_context"][struct_level] = text.strip()
-                        level_order = ["편", "부", "장", "절", "관"]
-                        if struct_level in level_order:
-                            idx = level_order.index(struct_level)
-                            for lower in level_order[idx + 1:]:
-                                current["structure_context"].pop(lower, None)
-                        continue
-
-                    art = _extract_article_no_safe(text)
-                    if art:
-                        flush()
-                        article_bbox_acc.clear()
-                        current["article_no"] = art
-                        current["paragraph_no"] = None
-                        current["page"] = page_no
-                        lang_hint_ln = "KO" if RE_KO_ARTICLE.match(text.lstrip()) else "EN"
-                        current["display_path"] = _build_display_path(art, lang_hint_ln)
-                        current["structure"] = {"article_number": art}
-                        if bbox is not None:
-                            _accum_bbox(article_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
-                            _accum_bbox(current["para_bbox_acc"], page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
-                        remainder = _extract_body_after_article_no(text, art)
-                        if remainder:
-                            fake_ln = dict(ln, text=remainder)
-                            if _has_hangul(remainder):
-                                current["ko_lines"].append(fake_ln)
-                                if current["page_ko"] is None:
-                                    current["page_ko"] = page_no
-                                if current["page_korean"] is None:
-                                    current["page_korean"] = page_no
-                            else:
-                                current["en_lines"].append(fake_ln)
-                                if current["page_en"] is None:
-                                    current["page_en"] = page_no
-                                if current["page_english"] is None:
-                                    current["page_english"] = page_no
-                        continue
-
-                    para_key: Optional[str] = None
-                    cm = _RE_CIRCLED.search(text)
-                    if cm:
-                        para_key = cm.group(0)
-                    elif current["article_no"]:
-                        m_num = re.match(r"^(\d+)\s+", text)
-                        if m_num and 1 <= int(m_num.group(1)) <= 20:
-                            para_key = m_num.group(1)
-
-                    if para_key:
-                        art_no_saved = current.get("article_no")
-                        flush()
-                        current["article_no"] = art_no_saved
-                        current["paragraph_no"] = para_key
-                        current["page"] = page_no
-                        current["structure"] = {
-                            "article_number": art_no_saved,
-                            "paragraph": para_key,
-                        }
-
-                    if _has_hangul(text):
-                        current["ko_lines"].append(ln)
-                        if current["page_ko"] is None:
-                            current["page_ko"] = page_no
-                        if current["page_korean"] is None:
-                            current["page_korean"] = page_no
-                    else:
-                        current["en_lines"].append(ln)
-                        if current["page_en"] is None:
-                            current["page_en"] = page_no
-                        if current["page_english"] is None:
-                            current["page_english"] = page_no
+                if not is_two_column or col_pair is None:
+                    # 1단
+                    for ln in lines:
+                        text = ln["text"]
+                        # 라인 텍스트는 이미 정규화(strip)되어 있으므로 표기가 없으면 치환 불필요.
+                        # 컬럼 경계에 걸친 라인은 좌/우 컬럼이 같은 dict를 공유하므로 바뀐 라인만 복사.
+                        if "법제처" in text:
+                            cleaned = _RE_LAW_STAMP.sub("", text).strip()
+                            if not cleaned:
+                                continue  # 함수가 아닌 루프이므로 continue
+                            ln = dict(ln, text=cleaned)
+                            text = cleaned
+                        bbox = ln.get("bbox")
+                        # ★ v4.1: page_height 조회
+                        ph = ln.get("page_height") or page_height_map.get(page_no, 0.0)
+
+                        struct_level = _is_struct_header(text)
+                        if struct_level:
+                            current.structure_context[struct_level] = text.strip()
+                            level_order = ["편", "부", "장", "절", "관"]
+                            if struct_level in level_order:
+                                idx = level_order.index(struct_level)
+                                for lower in level_order[idx + 1:]:
+                                    current.structure_context.pop(lower, None)
+                            continue
 
-                    if current["page"] is None:
-                        current["page"] = page_no
+                        art, art_lang = _extract_article_no_lang(text)
+                        if art:
+                            flush()
+                            article_bbox_acc.clear()
+                            current.article_no = art
+                            current.paragraph_no = None
+                            current.page = page_no
+                            lang_hint_ln = "KO" if art_lang == "KO" else "EN"
+                            current.display_path = _build_display_path(art, lang_hint_ln)
+                            current.structure = {"article_number": art}
+                            if bbox is not None:
+                                # 조/항 누적 모두 같은 bbox이므로 clamp는 한 번만
+                                box = _clamp_bbox(bbox, page_no=page_no, page_height=ph)  # ★ v4.1
+                                if box is not None:
+                                    _union_box(article_bbox_acc, page_no, box)
+                                    _union_box(current.para_bbox_acc, page_no, box)
+                            remainder = _extract_body_after_article_no(text, art)
+                            if remainder:
+                                fake_ln = dict(ln, text=remainder)
+                                if _has_hangul(remainder):
+                                    current.ko_lines.append(fake_ln)
+                                    if current.page_ko is None:
+                                        current.page_ko = page_no
+                                    if current.page_korean is None:
+                                        current.page_korean = page_no
+                                else:
+                                    current.en_lines.append(fake_ln)
+                                    if current.page_en is None:
+                                        current.page_en = page_no
+                                    if current.page_english is None:
+                                        current.page_english = page_no
+                            continue
 
-                    if bbox is not None:
-                        _accum_bbox(current["para_bbox_acc"], page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
+                        para_key: Optional[str] = None
+                        cm = _RE_CIRCLED.search(text)
+                        if cm:
+                            para_key = cm.group(0)
+                        elif current.article_no:
+                            m_num = _RE_LEAD_NUM.match(text) if text[:1].isdecimal() else None
+                            if m_num and 1 <= int(m_num.group(1)) <= 20:
+                                para_key = m_num.group(1)
+
+                        if para_key:
+                            art_no_saved = current.article_no
+                            flush()
+                            current.article_no = art_no_saved
+                            current.paragraph_no = para_key
+                            current.page = page_no
+                            current.structure = {
+                                "article_number": art_no_saved,
+                                "paragraph": para_key,
+                            }
+
+                        if _has_hangul(text):
+                            current.ko_lines.append(ln)
+                            if current.page_ko is None:
+                                current.page_ko = page_no
+                            if current.page_korean is None:
+                                current.page_korean = page_no
+                        else:
+                            current.en_lines.append(ln)
+                            if current.page_en is None:
+                                current.page_en = page_no
+                            if current.page_english is None:
+                                current.page_english = page_no
+
+                        if current.page is None:
+                            current.page = page_no
+
+                        if bbox is not None:
+                            _accum_bbox(current.para_bbox_acc, page_no=page_no, bbox=bbox, page_height=ph)  # ★ v4.1
 
-            else:
-                # 2단
-                left_lines, right_lines = col_pair
-                left_total = max(len(left_lines), 1)
-                right_total = max(len(right_lines), 1)
-                left_ko_ratio = sum(1 for ln in left_lines if _has_hangul(ln["text"])) / left_total
-                right_ko_ratio = sum(1 for ln in right_lines if _has_hangul(ln["text"])) / right_total
-                both_ko = left_ko_ratio >= 0.6 and right_ko_ratio >= 0.6
-                neither_ko = left_ko_ratio < 0.3 and right_ko_ratio < 0.3
-                is_newspaper = both_ko or neither_ko
-
-                if is_newspaper:
-                    _process_lines_single(left_lines + right_lines)
                 else:
-                    if left_ko_ratio >= right_ko_ratio:
-                        ko_col, foreign_col = left_lines, right_lines
+                    # 2단
+                    left_lines, right_lines = col_pair
+                    left_total = max(len(left_lines), 1)
+                    right_total = max(len(right_lines), 1)
+                    left_ko_ratio = sum(1 for ln in left_lines if _has_hangul(ln["text"])) / left_total
+                    right_ko_ratio = sum(1 for ln in right_lines if _has_hangul(ln["text"])) / right_total
+                    both_ko = left_ko_ratio >= 0.6 and right_ko_ratio >= 0.6
+                    neither_ko = left_ko_ratio < 0.3 and right_ko_ratio < 0.3
+                    is_newspaper = both_ko or neither_ko
+
+                    if is_newspaper:
+                        _process_lines_single(left_lines + right_lines)
                     else:
-                        ko_col, foreign_col = right_lines, left_lines
-                    _process_lines_single(ko_col, lang_hint_default="KO")
-                    for ln in foreign_col:
-                        text = ln["text"]
-                        if _extract_article_no_safe(text):
-                            continue
-                        current["en_lines"].append(ln)
-                        current["page_en"] = current["page_en"] or page_no
-                        current["page_english"] = current["page_english"] or page_no
-
-        flush()
-        doc.close()
-
-        cleaned: List[ConstitutionChunk] = []
-        for ch in chunks:
-            body = (ch.korean_text or "") + "\n" + (ch.english_text or "")
-            if len(body.strip()) < 30:
-                if not (ch.structure or {}).get("article_number"):
-                    continue
-            cleaned.append(ch)
-
-        merged: List[ConstitutionChunk] = []
-        for ch in cleaned:
-            text = (ch.korean_text or ch.english_text or "").strip()
-            has_article = bool((ch.structure or {}).get("article_number"))
-            if merged and (not has_article) and len(text) <= 40:
-                prev = merged[-1]
-                if ch.korean_text and prev.korean_text:
-                    prev.korean_text = (prev.korean_text.rstrip() + " " + ch.korean_text.lstrip()).strip()
-                elif ch.english_text and prev.english_text:
-                    prev.english_text = (prev.english_text.rstrip() + " " + ch.english_text.lstrip()).strip()
-                prev.search_text = (prev.search_text.rstrip() + "\n" + text).strip()
-                if ch.bbox_info:
-                    prev.bbox_info = _union_bbox_info(
-                        (prev.bbox_info or []) + ch.bbox_info, pad_x=2.0, pad_y=1.5)
-                if ch.article_bbox_info:
-                    prev.article_bbox_info = _union_bbox_info(
-                        (prev.article_bbox_info or []) + ch.article_bbox_info, pad_x=3.0, pad_y=2.5)
-                continue
-            merged.append(ch)
+                        if left_ko_ratio >= right_ko_ratio:
+                            ko_col, foreign_col = left_lines, right_lines
+                        else:
+                            ko_col, foreign_col = right_lines, left_lines
+                        _process_lines_single(ko_col, lang_hint_default="KO")
+                        for ln in foreign_col:
+                            text = ln["text"]
+                            if _extract_article_no_safe(text):
+                                continue
+                            current.en_lines.append(ln)
+                            current.page_en = current.page_en or page_no
+                            current.page_english = current.page_english or page_no
+
+                # 이 페이지까지 완성된 청크 방출 (병합 대상이 될 수 있는 마지막 청크는 보류)
+                if len(chunks) > 1:
+                    emitted += len(chunks) - 1
+                    yield from chunks[:-1]
+                    del chunks[:-1]
+
+            flush()
+            emitted += len(chunks)
+            yield from chunks
+        finally:
+            doc.close()
 
         layout_label = "2단" if is_two_column else "1단"
-        print(f"[Chunker] v4.1 {layout_label} 항 단위 청크 {len(merged)}개 생성")
-        return merged
+        print(f"[Chunker] v4.1 {layout_label} 항 단위 청크 {emitted}개 생성")
 
 
 # =========================
@@ -1659,6 +2117,7 @@ def chunk_constitution_document(
     include_merged_article_chunks: bool = False,  # 하위 호환용, 무시됨
     auto_detect_columns: bool = True,
     chunk_granularity: Optional[str] = None,
+    page_workers: Optional[int] = None,
 ) -> List[ConstitutionChunk]:
     """
     헌법 문서 청킹 메인 함수 (v4.1)
@@ -1677,6 +2136,7 @@ def chunk_constitution_document(
         assume_two_columns=True,
         auto_detect_columns=auto_detect_columns,
         chunk_granularity=resolved_granularity,
+        page_workers=page_workers,
     )
     return chunker.chunk(
         pdf_path,
@@ -0,0 +1,154 @@
+"""
+comparative_constitution_chunker 회귀 테스트.
+
+성능 개선으로 바뀐 경로(병렬 페이지 추출, iter_chunks 스트리밍, 조문 번호 추출 첫 글자 필터)가
+기존 동작과 같은 결과를 내는지 확인한다. PDF는 PyMuPDF로 테스트마다 생성.
+"""
+import random
+
+import fitz
+import pytest
+
+from app.services.chunkers import comparative_constitution_chunker as ccc
+
+
+KO_SENTENCES = [
+    "대한민국은 민주공화국이다.",
+    "대한민국의 주권은 국민에게 있고, 모든 권력은 국민으로부터 나온다.",
+    "모든 국민은 법 앞에 평등하다.",
+    "누구든지 성별·종교 또는 사회적 신분에 의하여 차별을 받지 아니한다.",
+    "대통령은 국가의 원수이며, 외국에 대하여 국가를 대표한다.",
+]
+EN_SENTENCES = [
+    "The Republic of Korea shall be a democratic republic.",
+    "The sovereignty of the Republic of Korea shall reside in the people,",
+    "and all state authority shall emanate from the people.",
+    "All citizens shall be equal before the law.",
+    "The President shall be the Head of State.",
+]
+CIRCLED = "①②③④⑤"
+
+
+def _make_korean_pdf(path, n_articles=40):
+    """1단 한국어 헌법: 장 제목, 항 번호, 반복 머리말/쪽 번호 포함."""
+    rng = random.Random(7)
+    doc = fitz.open()
+    page, y = None, 0
+    for a in range(1, n_articles + 1):
+        lines = [f"제{a}조"] + [
+            CIRCLED[i] + s for i, s in enumerate(rng.sample(KO_SENTENCES, rng.randint(1, 3)))
+        ]
+        if a % 10 == 1:
+            lines.insert(0, f"제{a // 10 + 1}장 총강")
+        for text in lines:
+            if page is None or y > 760:
+                page = doc.new_page(width=595, height=842)
+                page.insert_text((220, 40), "대한민국헌법", fontname="korea", fontsize=9)
+                page.insert_text((280, 820), f"- {doc.page_count} -", fontname="korea", fontsize=9)
+                y = 80
+            page.insert_text((60, y), text, fontname="korea", fontsize=10)
+            y += 14
+    doc.save(str(path))
+    doc.close()
+
+
+def _make_bilingual_pdf(path, n_articles=30):
+    """2단 영/한 대역 헌법: 왼쪽 영문, 오른쪽 국문."""
+    rng = random.Random(11)
+    doc = fitz.open()
+    page, y = None, 0
+    for a in range(1, n_articles + 1):
+        en = [f"Article {a}"] + rng.sample(EN_SENTENCES, rng.randint(1, 3))
+        ko = [f"제{a}조"] + rng.sample(KO_SENTENCES, rng.randint(1, 3))
+        if page is None or y + 14 * max(len(en), len(ko)) > 780:
+            page = doc.new_page(width=595, height=842)
+            page.insert_text((230, 35), "Constitution of Testland", fontsize=9)
+            page.insert_text((290, 825), str(doc.page_count), fontsize=9)
+            y = 80
+        for i, text in enumerate(en):
+            page.insert_textbox(fitz.Rect(40, y + 14 * i - 11, 285, y + 14 * i + 4), text, fontsize=8)
+        for i, text in enumerate(ko):
+            page.insert_text((315, y + 14 * i), text, fontname="korea", fontsize=9)
+        y += 14 * max(len(en), len(ko)) + 10
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture(scope="module")
+def sample_pdfs(tmp_path_factory):
+    base = tmp_path_factory.mktemp("pdfs")
+    ko, bi = base / "ko.pdf", base / "bi.pdf"
+    _make_korean_pdf(ko)
+    _make_bilingual_pdf(bi)
+    return {"ko": str(ko), "bi": str(bi)}
+
+
+def _chunk_dicts(pdf_path, **kwargs):
+    return [
+        c.to_dict()
+        for c in ccc.chunk_constitution_document(
+            pdf_path=pdf_path, doc_id="doc", country="KR", constitution_title="헌법", **kwargs
+        )
+    ]
+
+
+@pytest.mark.parametrize("name", ["ko", "bi"])
+@pytest.mark.parametrize("granularity", ["paragraph", "article"])
+def test_parallel_extraction_matches_sequential(sample_pdfs, name, granularity):
+    sequential = _chunk_dicts(sample_pdfs[name], chunk_granularity=granularity, page_workers=1)
+    parallel = _chunk_dicts(sample_pdfs[name], chunk_granularity=granularity, page_workers=3)
+    assert sequential
+    assert parallel == sequential
+
+
+@pytest.mark.parametrize("name", ["ko", "bi"])
+@pytest.mark.parametrize("granularity", ["paragraph", "article"])
+def test_iter_chunks_matches_chunk(sample_pdfs, name, granularity):
+    chunker = ccc.ComparativeConstitutionChunker(chunk_granularity=granularity, page_workers=1)
+    kwargs = dict(doc_id="doc", country="KR", constitution_title="헌법")
+    listed = [c.to_dict() for c in chunker.chunk(sample_pdfs[name], **kwargs)]
+    streamed = [c.to_dict() for c in chunker.iter_chunks(sample_pdfs[name], **kwargs)]
+    assert listed
+    assert streamed == listed
+
+
+def _reference_article_no_lang(line):
+    """첫 글자 필터/단일 패턴 도입 전의 분기별 판정."""
+    stripped = line.lstrip()
+    m = ccc.RE_KO_ARTICLE.match(stripped)
+    if m:
+        return m.group(1), "KO"
+    if ccc.RE_EN_ARTICLE_BODY_REF.match(stripped):
+        return None, None
+    m = ccc.RE_EN_ARTICLE_HEADER.match(stripped) or ccc.RE_EN_ARTICLE_PAREN.match(stripped)
+    if m:
+        return m.group(1), "EN"
+    m = ccc.re.match(r"^\d+\s+제\s*(\d+)\s*조", stripped)
+    if m:
+        return m.group(1), None
+    return None, None
+
+
+def _article_line_samples():
+    samples = [
+        "제1조 대한민국은 민주공화국이다.", "  제 12 조 ( 목적 )", "제3조의2", "제4조①국민은",
+        "Article 12 of the Constitution", "Article (3)", "ARTICLE 4.", "article 5", "Article 6 text",
+        "12 제3조 본문", "법제처 12", "대한민국헌법", "Page 3", "　제7조", "\t Article 8",
+        "", " ", "①제9조", "(제10조)", "Art. 11", "Articles 12", "7", "제조",
+    ]
+    rng = random.Random(1)
+    alphabet = list("제조항의 ①②()[]【〔 0123456789 가나 법제처 Article article ARTICLE of the . \t　abcXYZ")
+    samples += ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(5000)]
+    return samples
+
+
+def test_extract_article_no_lang_agrees_with_article_patterns():
+    for line in _article_line_samples():
+        no, lang = ccc._extract_article_no_lang(line)
+        assert (no, lang) == _reference_article_no_lang(line), repr(line)
+        stripped = line.lstrip()
+        assert (lang == "KO") == bool(ccc.RE_KO_ARTICLE.match(stripped)), repr(line)
+        # 첫 글자 필터로 건너뛴 라인은 KO/EN 조문 패턴에도 걸리지 않아야 함
+        if stripped[:1] not in ("제", "A", "a") and not stripped[:1].isdecimal():
+            assert not ccc.RE_KO_ARTICLE.match(stripped), repr(line)
+            assert not ccc.RE_EN_ARTICLE.match(stripped), repr(line)